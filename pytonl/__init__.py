@@ -4,7 +4,7 @@ TONL is a text-based serialization format designed for token efficiency in LLM c
 human readability, and bidirectional compatibility with JSON.
 """
 
-from typing import TextIO, overload
+from typing import BinaryIO, TextIO, overload
 
 from .__version__ import __version__
 from .decoder import TONLDecoder
@@ -22,14 +22,30 @@ from .types import (
 def decode(src: str, options: DecodeOptions | None = None) -> JSONValue: ...
 
 
+@overload
+def decode(src: bytes, options: DecodeOptions | None = None) -> JSONValue: ...
+
+
 @overload
 def decode(src: TextIO, options: DecodeOptions | None = None) -> JSONValue: ...
 
 
-def decode(src: str | TextIO, options: DecodeOptions | None = None) -> JSONValue:
-    """Convenience function to decode TONL string to Python object."""
+@overload
+def decode(src: BinaryIO, options: DecodeOptions | None = None) -> JSONValue: ...
+
+
+def decode(src: str | bytes | TextIO | BinaryIO, options: DecodeOptions | None = None) -> JSONValue:
+    """Convenience function to decode TONL string to Python object.
+
+    ``bytes`` input is decoded as UTF-8. File objects are read line by line
+    rather than loaded into a single string first.
+    """
     decoder = TONLDecoder(options)
-    return decoder.decode(src if isinstance(src, str) else src.read())
+    if isinstance(src, bytes):
+        return decoder.decode(src.decode("utf-8"))
+    if isinstance(src, str):
+        return decoder.decode(src)
+    return decoder.decode_stream(src)
 
 
 def encode(data: JSONValue, options: EncodeOptions | None = None) -> str:
@@ -1,51 +1,160 @@
 """TONL decoder - converts TONL format to JSON/Python objects."""
 
-import re
-from typing import Any
+from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any, NamedTuple
 
 from .types import DecodeOptions, JSONValue
 from .utils import (
     coerce_typed_value,
+    make_line_splitter,
     parse_key_value_pairs,
     parse_primitive_value,
-    split_line_by_delimiter,
 )
 
 
+def _is_word(s: str) -> bool:
+    """Check if a string is a non-empty run of word characters (regex ``\\w+``)."""
+    return s.replace("_", "a").isalnum()
+
+
+def _has_unescaped_triple_quote(s: str) -> bool:
+    """Check if a line contains a closing triple quote not escaped with a backslash."""
+    idx = s.find('"""')
+    while idx != -1:
+        if idx == 0 or s[idx - 1] != "\\":
+            return True
+        idx = s.find('"""', idx + 3)
+    return False
+
+
+def _make_row_parser(
+    columns: list[str], type_hints: dict[str, str], strict: bool
+) -> Callable[[list[str]], dict[str, Any]]:
+    """Build a function turning the split values of a tabular row into an object.
+
+    Each column's value parser is resolved once: typed coercion for hinted columns
+    in strict mode, generic primitives otherwise. Missing trailing cells are left
+    out of the row object.
+    """
+    if not strict or not any(type_hints.get(col) for col in columns):
+        # No coercion needed: build the row entirely with C-level builtins
+        def parse_plain_row(values: list[str]) -> dict[str, Any]:
+            return dict(zip(columns, map(parse_primitive_value, values), strict=False))
+
+        return parse_plain_row
+
+    parsers: list[tuple[str, Callable[[str], Any]]] = []
+    for col in columns:
+        hint = type_hints.get(col)
+        if hint:
+            parsers.append((col, partial(coerce_typed_value, type_hint=hint, strict=True)))
+        else:
+            parsers.append((col, parse_primitive_value))
+
+    def parse_typed_row(values: list[str]) -> dict[str, Any]:
+        return {col: parse(raw) for (col, parse), raw in zip(parsers, values, strict=False)}
+
+    return parse_typed_row
+
+
+class _HeaderInfo(NamedTuple):
+    """Parsed block header line, e.g. ``users[2]{id,name:str}: rest``."""
+
+    key: str
+    is_array: bool
+    array_size: int | None
+    columns: list[str]
+    type_hints: dict[str, str]
+    rest: str
+
+
 class TONLDecoder:
     """Decoder for converting TONL format to Python objects."""
 
+    __slots__ = ("options", "delimiter", "_split_row", "_stripped", "_indents")
+
     def __init__(self, options: DecodeOptions | None = None):
         """Initialize decoder with options."""
         self.options = options or DecodeOptions()
         self.delimiter = ","  # Default delimiter
+        self._split_row = make_line_splitter(self.delimiter)
+        # Per-line tables filled by decode(): stripped text and indentation width
+        self._stripped: list[str] = []
+        self._indents: list[int] = []
 
     def decode(self, tonl_str: str) -> JSONValue:
         """Decode TONL string to Python object."""
-        lines = tonl_str.splitlines()
-
-        # Parse headers first to get version and delimiter
-        start_idx = self._parse_headers(lines)
+        return self._decode_lines(tonl_str.splitlines())
+
+    def decode_stream(self, src: Iterable[str] | Iterable[bytes]) -> JSONValue:
+        """Decode TONL read line by line from a file object or other iterable of lines.
+
+        Unlike ``decode(src.read())``, the document is never held as one string.
+        Lines read from binary files are decoded as UTF-8.
+        """
+        lines: list[str] = []
+        for line in src:
+            if isinstance(line, bytes):
+                line = line.decode("utf-8")
+            # Chunks end at "\n" only; split the rest like ``str.splitlines`` does
+            lines.extend(line.splitlines())
+        return self._decode_lines(lines)
+
+    def _decode_lines(self, lines: list[str]) -> JSONValue:
+        """Decode a TONL document already split into lines."""
+        # Strip and measure every line once; the parsers below only look these up
+        stripped: list[str] = []
+        indents: list[int] = []
+        for line in lines:
+            content = line.lstrip()
+            indents.append(len(line) - len(content))
+            stripped.append(content.rstrip())
+        self._stripped = stripped
+        self._indents = indents
+        try:
+            return self._parse_document(lines)
+        finally:
+            # Don't keep the last document's tables alive on a long-lived decoder
+            self._stripped = []
+            self._indents = []
+
+    def _parse_document(self, lines: list[str]) -> JSONValue:
+        """Parse headers and top-level items from the per-line tables."""
+        stripped = self._stripped
+
+        # Parse headers first to get version and delimiter. Documents whose first
+        # non-blank line is not a "#" header or "@" directive have none to parse.
+        first = next(filter(None, stripped), "")
+        if first.startswith(("#", "@")):
+            start_idx = self._parse_headers(lines)
+        else:
+            start_idx = 0
+        # The delimiter is fixed from here on, so specialize the row splitter once
+        self._split_row = make_line_splitter(self.delimiter)
 
         # Parse data
-        data_lines = lines[start_idx:]
-        if not data_lines:
+        if start_idx >= len(lines):
             return {}
 
         # Parse all top-level items
-        result = {}
-        i = 0
-        while i < len(data_lines):
-            line = data_lines[i]
-            if not line.strip():
+        result: JSONValue = {}
+        i = start_idx
+        while i < len(lines):
+            if not stripped[i]:
                 i += 1
                 continue
 
-            sub_result, sub_consumed = self._parse_lines(data_lines[i:], 0)
+            start = i
+            sub_result, i = self._parse_lines(lines, i, 0)
 
             if sub_result is not None:
                 if isinstance(sub_result, dict):
-                    result.update(sub_result)
+                    if not isinstance(result, dict):
+                        raise ValueError(
+                            f"Top-level object item follows a non-object value: {stripped[start]!r}"
+                        )
+                    result |= sub_result
                 elif not result:
                     # If result is empty and we got a non-dict, this is the single result
                     # (e.g. top-level array or primitive)
@@ -53,15 +162,13 @@ class TONLDecoder:
                     # unless we treat them as a list? No, TONL top-level is usually object.
                     result = sub_result
 
-            i += sub_consumed
-
         # Unwrap top-level single-key results based on value type
         # - "root{...}:" -> unwrap to get {...}
         # - "users[2]{...}:" -> unwrap array to get [...]
         # - "config{...}:" -> keep as {'config': {...}} (object with meaningful key)
         # - "value: null" -> unwrap primitive to get null
         if isinstance(result, dict) and len(result) == 1:
-            key = list(result.keys())[0]
+            key = next(iter(result))
             value = result[key]
 
             if key == "root":
@@ -71,11 +178,18 @@ class TONLDecoder:
 
     def _parse_headers(self, lines: list[str]) -> int:
         """Parse headers and return index of first data line."""
-        i = 0
-        for original_line in lines:
-            line = original_line.strip()
+        stripped = self._stripped
+        # Common case: a lone "#version 1.0" header directly followed by data
+        if (
+            len(stripped) > 1
+            and stripped[0] == "#version 1.0"
+            and stripped[1]
+            and not stripped[1].startswith(("#", "@"))
+        ):
+            return 1
+
+        for i, line in enumerate(stripped):
             if not line:
-                i += 1
                 continue
 
             if line.startswith("#version"):
@@ -86,46 +200,33 @@ class TONLDecoder:
                 if len(parts) != 2 or parts[0] != "#version" or parts[1] != "1.0":
                     raise ValueError(f"Unsupported TONL version header: {line!r}")
             elif line.startswith("#delimiter"):
-                # Use original line to preserve whitespace delimiter
-                # But we need to handle indentation? Headers shouldn't be indented.
-                # Check if original_line starts with #delimiter (ignoring leading whitespace?)
-                # No, headers must be at start of line?
-                # Let's assume headers are not indented or we strip leading only.
-
-                stripped_start = original_line.lstrip()
-                if stripped_start.startswith("#delimiter"):
-                    raw_val = stripped_start[10:]
-                    # Strip newline only
-                    val_part = raw_val.rstrip("\n").rstrip("\r")
-
-                    if not val_part.strip():
-                        # If empty after strip, check if it contained tab
-                        if "\t" in val_part:
-                            self.delimiter = "\t"
-                    else:
-                        delim = val_part.strip()
-                        if delim == "\\t":
-                            self.delimiter = "\t"
-                        else:
-                            self.delimiter = delim
+                # Use the raw line to preserve a whitespace (tab) delimiter, which
+                # the stripped line has lost.
+                val_part = lines[i].lstrip()[10:]
+                delim = val_part.strip()
+                if not delim:
+                    # If empty after strip, check if it contained tab
+                    if "\t" in val_part:
+                        self.delimiter = "\t"
+                elif delim == "\\t":
+                    self.delimiter = "\t"
+                else:
+                    self.delimiter = delim
             elif line.startswith("@"):
                 # Directive - ignore for now
                 pass
             else:
                 # Not a header
-                break
-            i += 1
-        return i
+                return i
+        return len(stripped)
 
-    def _parse_lines(self, lines: list[str], indent_level: int) -> tuple[Any, int]:
-        """Parse lines at a given indentation level."""
-        if not lines:
-            return None, 0
-
-        first_line = lines[0]
+    def _parse_lines(self, lines: list[str], start: int, indent_level: int) -> tuple[Any, int]:
+        """Parse lines starting at ``start`` and return the result and the end index."""
+        if start >= len(lines):
+            return None, start
 
         # Parse the first line to determine structure
-        stripped = first_line.strip()
+        stripped = self._stripped[start]
 
         # Check for block header (Object or Array)
         # Matches: key{cols}: or key[N]: or key[N]{cols}:
@@ -133,15 +234,15 @@ class TONLDecoder:
 
         if header_match:
             # It's a block (object or array)
-            result, consumed = self._parse_block(lines, header_match)
-            key = header_match["key"]
+            result, end = self._parse_block(lines, start, header_match)
+            key = header_match.key
 
             # If the key is an array index like "[0]", return result unwrapped
             # Otherwise wrap in {key: result} dict
             if key.startswith("[") and key.endswith("]"):
-                return result, consumed
+                return result, end
             else:
-                return {key: result}, consumed
+                return {key: result}, end
 
         # Check for key-value pair
         kv_match = self._parse_key_value(stripped)
@@ -152,229 +253,244 @@ class TONLDecoder:
             stripped_value = value_str.strip()
             if stripped_value.startswith('"""') and not stripped_value.endswith('"""'):
                 # Accumulate subsequent lines until we find an unescaped closing """
-                combined = stripped_value
-                lines_consumed = 1
-
-                def has_unescaped_triple_quote(s: str) -> bool:
-                    idx = 0
-                    while True:
-                        idx = s.find('"""', idx)
-                        if idx == -1:
-                            return False
-                        # Closing triple quote is not escaped with a backslash
-                        if idx == 0 or s[idx - 1] != "\\":
-                            return True
-                        idx += 3
-
-                i = 1
-                while i < len(lines):
+                parts = [stripped_value]
+                i = start + 1
+                end = len(lines)
+                while i < end:
                     next_line = lines[i]
-                    combined += "\n" + next_line
-                    lines_consumed += 1
-                    if has_unescaped_triple_quote(next_line):
-                        break
+                    parts.append(next_line)
                     i += 1
+                    if _has_unescaped_triple_quote(next_line):
+                        break
 
-                value = parse_primitive_value(combined)
-                return {key: value}, lines_consumed
+                value = parse_primitive_value("\n".join(parts))
+                return {key: value}, i
 
             # Regular single-line primitive value
             value = parse_primitive_value(value_str)
-            return {key: value}, 1
+            return {key: value}, start + 1
 
         # Check for primitive array (implicit key from context?)
         # No, top level primitive array usually has key[N]: ...
         # If we are here, it might be a continuation or invalid line
-        return None, 1
+        return None, start + 1
 
-    def _parse_header(self, line: str) -> dict[str, Any] | None:
+    def _parse_header(self, line: str) -> _HeaderInfo | None:
         """Parse a block header line."""
-        # Regex for headers:
-        # Group 1: Key
-        # Group 2: Array size (optional)
-        # Group 3: Columns (optional)
-        # Group 4: Rest of line (optional)
-
-        # Pattern matches: key[size]{cols}: or key{cols}: or key[size]:
-        # Updated regex to require either [] or {} to avoid matching simple key: value
-        pattern = r"^(\w+|\[\d+\])(?:\[(\d+)\])?(?:\{([^}]*)\})?:\s*(.*)$"
-        match = re.match(pattern, line)
-
-        if match:
-            key = match.group(1)
-            array_size = match.group(2)
-            columns_str = match.group(3)
-            rest = match.group(4)
-
-            # Must have either array brackets or column braces to be a header
-            # (Regex guarantees : at end, but we need to ensure it's not just key:)
-            if array_size is None and columns_str is None:
+        # Headers look like: key[size]{cols}: rest, key{cols}: rest or key[size]: rest
+        # where key is either a word or an array index like [0]. Most lines are
+        # plain "key: value" pairs, so bail out early when there is no [ or {.
+        if line.startswith("["):
+            # Array index key, e.g. "[0]{id,name}: ..." or "[4][3]: 1, 2, 3"
+            close = line.find("]")
+            if close == -1 or not line[1:close].isdecimal():
                 return None
+            pos = close + 1
+        else:
+            bracket = line.find("[")
+            brace = line.find("{")
+            if bracket == -1 and brace == -1:
+                return None
+            if bracket == -1 or (brace != -1 and brace < bracket):
+                pos = brace
+            else:
+                pos = bracket
+            if not _is_word(line[:pos]):
+                return None
+        key = line[:pos]
 
-            is_array = array_size is not None
-            columns: list[str] = []
-            type_hints: dict[str, str] = {}
-            if columns_str:
-                # Parse columns, capturing optional type hints (e.g. col:u32)
-                col_parts = columns_str.split(",")
-                for part in col_parts:
-                    part = part.strip()
-                    if not part:
-                        continue
-                    if ":" in part:
-                        name, hint = part.split(":", 1)
-                        name = name.strip()
-                        hint = hint.strip()
-                        if name:
-                            columns.append(name)
-                            if hint:
-                                type_hints[name] = hint
-                    else:
-                        columns.append(part)
-
-            return {
-                "key": key,
-                "is_array": is_array,
-                "array_size": int(array_size) if array_size else None,
-                "columns": columns,
-                "type_hints": type_hints,
-                "rest": rest,
-            }
-        return None
+        array_size = None
+        if line.startswith("[", pos):
+            close = line.find("]", pos)
+            if close == -1 or not line[pos + 1 : close].isdecimal():
+                return None
+            array_size = line[pos + 1 : close]
+            pos = close + 1
+
+        columns_str = None
+        if line.startswith("{", pos):
+            close = line.find("}", pos)
+            if close == -1:
+                return None
+            columns_str = line[pos + 1 : close]
+            pos = close + 1
+
+        # Must have either array brackets or column braces to be a header,
+        # immediately followed by the terminating colon.
+        if (array_size is None and columns_str is None) or not line.startswith(":", pos):
+            return None
+        rest = line[pos + 1 :].lstrip()
+
+        is_array = array_size is not None
+        columns: list[str] = []
+        type_hints: dict[str, str] = {}
+        if columns_str:
+            # Parse columns, capturing optional type hints (e.g. col:u32)
+            col_parts = columns_str.split(",")
+            for part in col_parts:
+                part = part.strip()
+                if not part:
+                    continue
+                if ":" in part:
+                    name, hint = part.split(":", 1)
+                    name = name.strip()
+                    hint = hint.strip()
+                    if name:
+                        columns.append(name)
+                        if hint:
+                            type_hints[name] = hint
+                else:
+                    columns.append(part)
+
+        return _HeaderInfo(
+            key=key,
+            is_array=is_array,
+            array_size=int(array_size) if array_size else None,
+            columns=columns,
+            type_hints=type_hints,
+            rest=rest,
+        )
 
     def _parse_key_value(self, line: str) -> tuple[str, str] | None:
         """Parse a key-value pair line."""
         # Match regular keys (word characters) or array indices like [0]
-        pattern = r"^(\w+|\[\d+\]):\s*(.*)$"
-        match = re.match(pattern, line)
-        if match:
-            return match.group(1), match.group(2)
+        key, sep, value = line.partition(":")
+        if not sep:
+            return None
+        if _is_word(key) or (key[:1] == "[" and key[-1:] == "]" and key[1:-1].isdecimal()):
+            return key, value.lstrip()
         return None
 
-    def _parse_block(self, lines: list[str], header_info: dict[str, Any]) -> tuple[Any, int]:
-        """Parse a block (object or array)."""
-        is_array = header_info["is_array"]
-        columns = header_info["columns"]
-        type_hints: dict[str, str] = header_info.get("type_hints", {})
-        rest = header_info["rest"]
+    def _parse_block(
+        self, lines: list[str], start: int, header_info: _HeaderInfo
+    ) -> tuple[Any, int]:
+        """Parse a block (object or array) and return the result and the end index."""
+        is_array = header_info.is_array
+        columns = header_info.columns
+        type_hints = header_info.type_hints
+        rest = header_info.rest
 
         # Calculate indentation of children
-        first_line_indent = len(lines[0]) - len(lines[0].lstrip())
+        stripped = self._stripped
+        indents = self._indents
+        first_line_indent = indents[start]
 
         # If we have content on the same line, it's a single-line block
         if rest:
             if is_array:
                 # Primitive array on same line
                 if not rest.strip():
-                    return [], 1
-                values = split_line_by_delimiter(rest, self.delimiter)
+                    return [], start + 1
+                values = self._split_row(rest)
                 parsed_values = [parse_primitive_value(v) for v in values]
-                return parsed_values, 1
+                return parsed_values, start + 1
             else:
                 # Single line object
                 # Parse key: value pairs from the rest of the line, applying
                 # type hints in strict mode when present.
                 obj = parse_key_value_pairs(rest, type_hints=type_hints, strict=self.options.strict)
-                return obj, 1
+                return obj, start + 1
 
         # Multi-line block
-        lines_consumed = 1
-        result = [] if is_array else {}
+        i = start + 1
+        end = len(lines)
 
         if is_array:
             # Check if tabular (uniform object array)
             # If we have columns defined in header, it's tabular
             if columns:
                 # Tabular array
-                # Each following line is a row of values
-                while lines_consumed < len(lines):
-                    line = lines[lines_consumed]
-                    line_indent = len(line) - len(line.lstrip())
-
-                    if line.strip() and line_indent <= first_line_indent:
+                parse_row = _make_row_parser(columns, type_hints, self.options.strict)
+
+                # Preallocate the declared number of rows, capped at the lines left so
+                # an untrusted size cannot force a huge allocation; rows beyond it are
+                # appended and unused slots are trimmed afterwards.
+                size = min(header_info.array_size or 0, end - start - 1)
+                rows: list[Any] = [None] * size
+                count = 0
+
+                split_row = self._split_row
+
+                # Each following line is a row of values. Rows never nest, so a
+                # plain for loop over the line range is enough here.
+                for i in range(start + 1, end):
+                    row = stripped[i]
+                    if not row:
+                        continue
+                    if indents[i] <= first_line_indent:
                         break
 
-                    if line.strip():
-                        row_values = split_line_by_delimiter(line.strip(), self.delimiter)
-                        obj: dict[str, Any] = {}
-                        for j, col in enumerate(columns):
-                            if j < len(row_values):
-                                raw = row_values[j]
-                                hint = type_hints.get(col)
-                                if hint and self.options.strict:
-                                    obj[col] = coerce_typed_value(raw, hint, strict=True)
-                                else:
-                                    obj[col] = parse_primitive_value(raw)
-                        result.append(obj)
-
-                    lines_consumed += 1
+                    obj = parse_row(split_row(row))
+                    if count < size:
+                        rows[count] = obj
+                    else:
+                        rows.append(obj)
+                    count += 1
+                else:
+                    i = end
 
-                return result, lines_consumed
+                del rows[count:]
+                return rows, i
 
             # Mixed array with indexed elements, and optionally primitive arrays
             # rendered on a separate indented line (for long single-line arrays).
-            result = []
-            i = 1
-            while i < len(lines):
-                line = lines[i]
-                line_indent = len(line) - len(line.lstrip())
-
-                if line.strip() and line_indent <= first_line_indent:
+            items: list[Any] = []
+            append = items.append
+            parse_lines = self._parse_lines
+            split_row = self._split_row
+            parse_value = parse_primitive_value
+            while i < end:
+                stripped_child = stripped[i]
+                line_indent = indents[i]
+
+                if stripped_child and line_indent <= first_line_indent:
                     break
 
-                stripped_child = line.strip()
                 if stripped_child:
                     # If this line starts with an explicit index (e.g. "[0]: text"
                     # or "[3]{id,name}: ..."), delegate to the generic parser so
                     # mixed arrays keep working as before.
                     if stripped_child.startswith("["):
-                        sub_result, sub_consumed = self._parse_lines(lines[i:], line_indent)
+                        sub_result, i = parse_lines(lines, i, line_indent)
 
                         # Unwrap array item key if present (e.g. {'[0]': 'value'} -> 'value')
                         if isinstance(sub_result, dict) and len(sub_result) == 1:
-                            key = list(sub_result.keys())[0]
+                            key = next(iter(sub_result))
                             if key.startswith("[") and key.endswith("]"):
                                 sub_result = sub_result[key]
 
-                        result.append(sub_result)
-                        i += sub_consumed
-                        lines_consumed += sub_consumed
+                        append(sub_result)
                     else:
                         # Primitive array values rendered on a child line, e.g.
                         #   items[4]:
                         #     a, b, c, d
                         # Split this line by the current delimiter and append
                         # each parsed primitive to the result.
-                        row_values = split_line_by_delimiter(stripped_child, self.delimiter)
-                        for raw in row_values:
-                            result.append(parse_primitive_value(raw))
+                        for raw in split_row(stripped_child):
+                            append(parse_value(raw))
                         i += 1
-                        lines_consumed += 1
                 else:
                     i += 1
-                    lines_consumed += 1
 
-            return result, lines_consumed
+            return items, i
 
         else:
             # Object
             # Parse children
-            i = 1
-            while i < len(lines):
-                line = lines[i]
-                line_indent = len(line) - len(line.lstrip())
+            result: dict[str, Any] = {}
+            parse_lines = self._parse_lines
+            while i < end:
+                line_indent = indents[i]
+                stripped_child = stripped[i]
 
-                if line.strip() and line_indent <= first_line_indent:
+                if stripped_child and line_indent <= first_line_indent:
                     break
 
-                if line.strip():
-                    sub_result, sub_consumed = self._parse_lines(lines[i:], line_indent)
+                if stripped_child:
+                    sub_result, i = parse_lines(lines, i, line_indent)
                     if isinstance(sub_result, dict):
-                        result.update(sub_result)
-                    i += sub_consumed
-                    lines_consumed += sub_consumed
+                        result |= sub_result
                 else:
                     i += 1
-                    lines_consumed += 1
 
-            return result, lines_consumed
+            return result, i
@@ -1,11 +1,41 @@
 """TONL encoder - converts JSON/Python objects to TONL format."""
 
 import math
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from .types import EncodeOptions, JSONValue
 from .utils import infer_type, needs_quoting, quote_string, select_best_delimiter
 
+# Exact types encoded as primitives by ``_encode_value``
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_INF = math.inf
+_NEG_INF = -math.inf
+
+# Type hints left out of column definitions
+_UNHINTED_TYPES = frozenset({"obj", "list"})
+
+# Formatted booleans indexed by value
+_BOOL_STRS = ("false", "true")
+
+# Formatted small integers, indexed by ``value - _SMALL_INT_MIN``
+_SMALL_INT_MIN = -128
+_SMALL_INT_MAX = 512
+_SMALL_INT_STRS = tuple(str(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX))
+
+# Precomputed "[i]" keys for mixed array elements
+_INDEX_KEY_COUNT = 1024
+_INDEX_KEYS = tuple(f"[{i}]" for i in range(_INDEX_KEY_COUNT))
+
+# Maximum number of formatted strings remembered per encode
+_QUOTE_CACHE_SIZE = 4096
+
+# Array layouts returned by ``_classify_array``
+_TABULAR_ARRAY = 0
+_PRIMITIVE_ARRAY = 1
+_MIXED_ARRAY = 2
+
 
 class TONLEncoder:
     """Encoder for converting Python objects to TONL format."""
@@ -13,14 +43,33 @@ class TONLEncoder:
     def __init__(self, options: EncodeOptions):
         """Initialize encoder with options."""
         self.options = options
+        # Options read on hot paths, copied out of ``options``
+        self._threshold = options.single_line_threshold
+        self._include_types = options.include_types
         self.indent_level = 0
         self.delimiter: str = ","  # Selected during encoding
+        self._delimiter_sep = ", "  # Separator between array values, set with the delimiter
+        # Indentation strings by level, grown lazily by ``_indent``
+        self._indent_unit = " " * options.indent
+        self._indents = [""]
+        # Formatted strings by (value, context), valid for the current delimiter only
+        self._quote_cache: dict[tuple[str, bool, bool], str] = {}
 
     def encode(self, data: JSONValue) -> str:
         """Encode Python object to TONL string."""
         self.delimiter = self.options.delimiter or select_best_delimiter(data)
+        self._quote_cache.clear()
 
-        lines = []
+        # Format delimiter - comma has no leading space, others have space on both sides
+        if self.delimiter == ",":
+            self._delimiter_sep = ", "
+        elif self.delimiter == "\t":
+            self._delimiter_sep = "\t"
+        else:
+            self._delimiter_sep = f" {self.delimiter} "
+
+        # Every encoding method appends its output lines to this single buffer
+        lines: list[str] = []
 
         # Add version header
         lines.append(f"#version {self.options.version}")
@@ -39,106 +88,157 @@ class TONLEncoder:
             key = next(iter(data))
             val = data[key]
             if isinstance(val, (dict, list)):
-                root_lines = self._encode_value(val, key)
+                self._encode_value(val, key, lines)
             else:
-                root_lines = self._encode_value(data, "root")
+                self._encode_value(data, "root", lines)
         else:
-            root_lines = self._encode_value(data, "root")
-
-        lines.extend(root_lines)
+            self._encode_value(data, "root", lines)
 
         return "\n".join(lines)
 
-    def _encode_value(self, value: Any, key: str) -> list[str]:
-        """Encode a value with a given key."""
-        if isinstance(value, dict):
-            return self._encode_object(value, key)
+    def _encode_value(self, value: Any, key: str, out: list[str]) -> None:
+        """Encode a value with a given key, appending lines to ``out``."""
+        # Exact type checks cover every JSON payload; subclasses such as
+        # ``OrderedDict`` fall through to the isinstance checks below.
+        t = type(value)
+        if t is dict:
+            self._encode_object(value, key, out)
+        elif t is list:
+            self._encode_array(value, key, out)
+        elif t in _PRIMITIVE_TYPES:
+            self._encode_primitive(value, key, out)
+        elif isinstance(value, dict):
+            self._encode_object(value, key, out)
         elif isinstance(value, list):
-            return self._encode_array(value, key)
+            self._encode_array(value, key, out)
         else:
-            return self._encode_primitive(value, key)
+            self._encode_primitive(value, key, out)
 
     def _format_primitive_value(
         self, value: Any, in_single_line_object: bool = False, in_tabular_context: bool = False
     ) -> str:
         """Format a primitive value for TONL output."""
+        formatter: Callable[..., str] = self._FORMATTERS.get(type(value), TONLEncoder._format_other)
+        return formatter(self, value, in_single_line_object, in_tabular_context)
+
+    def _format_str(
+        self, value: str, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format a string value, quoting it when the context requires."""
+        # Repeated values (categorical columns, enum-like strings) skip the scan
+        cache_key = (value, in_single_line_object, in_tabular_context)
+        cached = self._quote_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if needs_quoting(value, self.delimiter, in_single_line_object, in_tabular_context):
+            formatted = quote_string(value)
+        else:
+            formatted = value
+        if len(self._quote_cache) < _QUOTE_CACHE_SIZE:
+            self._quote_cache[cache_key] = formatted
+        return formatted
+
+    def _format_int(
+        self, value: int, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format an integer value."""
+        if _SMALL_INT_MIN <= value < _SMALL_INT_MAX:
+            return _SMALL_INT_STRS[value - _SMALL_INT_MIN]
+        return str(value)
+
+    def _format_float(
+        self, value: float, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format a float value."""
+        if value != value:
+            return "NaN"
+        if value == _INF:
+            return "Infinity"
+        if value == _NEG_INF:
+            return "-Infinity"
+        # Format float values to match examples:
+        # - Preserve natural representation for non-integers (e.g., 95.5 -> "95.5")
+        # - Integer-valued floats print with a single decimal digit (e.g., "1500.0");
+        #   pad them to two decimal places as in the money examples ("1500.00").
+        #   Large values print in exponent form without the ".0" and are kept as is.
+        s = str(value)
+        if s.endswith(".0"):
+            return s + "0"
+        return s
+
+    def _format_bool(
+        self, value: bool, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format a boolean value."""
+        return _BOOL_STRS[value]
+
+    def _format_null(
+        self, value: None, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format a null value."""
+        return "null"
+
+    def _format_other(
+        self, value: Any, in_single_line_object: bool = False, in_tabular_context: bool = False
+    ) -> str:
+        """Format a value whose exact type has no formatter (e.g. IntEnum, str subclasses)."""
         if isinstance(value, bool):
-            return "true" if value else "false"
-        elif isinstance(value, (int, float)):
-            if isinstance(value, float):
-                if math.isnan(value):
-                    return "NaN"
-                if math.isinf(value):
-                    return "Infinity" if value > 0 else "-Infinity"
-                # Format float values to match examples:
-                # - Preserve natural representation for non-integers (e.g., 95.5 -> "95.5")
-                # - For integer-valued floats, prefer two decimal places when there is a
-                #   single decimal digit (e.g., 1500.0 -> "1500.00" as in money examples).
-                s = str(value)
-                if "." not in s:
-                    return s
-                whole, frac = s.split(".", 1)
-                # Only pad when the float is mathematically integral and has a single
-                # decimal digit in its string form (e.g., "1500.0").
-                if value.is_integer() and len(frac) == 1:
-                    return f"{whole}.{frac}0"
-                return s
+            return self._format_bool(value)
+        elif isinstance(value, float):
+            return self._format_float(value)
+        elif isinstance(value, int):
             return str(value)
         elif isinstance(value, str):
-            needs = needs_quoting(value, self.delimiter, in_single_line_object, in_tabular_context)
-            if needs:
-                return quote_string(value)
-            return value
-        elif value is None:
-            return "null"
+            return self._format_str(value, in_single_line_object, in_tabular_context)
         return str(value)
 
-    def _encode_primitive(self, value: Any, key: str) -> list[str]:
+    # Primitive formatters keyed by exact type, see ``_format_primitive_value``. Plain
+    # functions rather than bound methods, so instances hold no reference to themselves.
+    _FORMATTERS: ClassVar[dict[type, Callable[..., str]]] = {
+        str: _format_str,
+        int: _format_int,
+        float: _format_float,
+        bool: _format_bool,
+        type(None): _format_null,
+    }
+
+    def _encode_primitive(self, value: Any, key: str, out: list[str]) -> None:
         """Encode a primitive value."""
         indent = self._indent()
         formatted = self._format_primitive_value(value)
-        return [f"{indent}{key}: {formatted}"]
+        out.append(f"{indent}{key}: {formatted}")
 
-    def _encode_array(self, arr: list[Any], key: str) -> list[str]:
+    def _encode_array(self, arr: list[Any], key: str, out: list[str]) -> None:
         """Encode an array."""
         if not arr:
             indent = self._indent()
-            return [f"{indent}{key}[0]:"]
-
-        # Check if it's a uniform array of objects (tabular candidate)
-        if self._is_uniform_object_array(arr):
-            return self._encode_tabular_array(arr, key)
-
-        # Check if it's a simple primitive array
-        if all(not isinstance(x, (dict, list)) for x in arr):
-            return self._encode_primitive_array(arr, key)
-
-        # Mixed array
-        return self._encode_mixed_array(arr, key)
+            out.append(f"{indent}{key}[0]:")
+        else:
+            kind = self._classify_array(arr)
+            if kind == _TABULAR_ARRAY:
+                self._encode_tabular_array(arr, key, out)
+            elif kind == _PRIMITIVE_ARRAY:
+                self._encode_primitive_array(arr, key, out)
+            else:
+                self._encode_mixed_array(arr, key, out)
 
-    def _encode_primitive_array(self, arr: list[Any], key: str) -> list[str]:
+    def _encode_primitive_array(self, arr: list[Any], key: str, out: list[str]) -> None:
         """Encode an array of primitive values."""
         indent = self._indent()
 
         # Format all values
-        formatted_values = [self._format_primitive_value(x) for x in arr]
-
-        # Format delimiter - comma has no leading space, others have space on both sides
-        if self.delimiter == ",":
-            delimiter_sep = ", "
-        elif self.delimiter == "\t":
-            delimiter_sep = "\t"
-        else:
-            delimiter_sep = f" {self.delimiter} "
+        formatted_values = self._format_column(arr)
 
-        joined = delimiter_sep.join(formatted_values)
+        joined = self._delimiter_sep.join(formatted_values)
 
-        if len(joined) < self.options.single_line_threshold:
-            return [f"{indent}{key}[{len(arr)}]: {joined}"]
+        if len(joined) < self._threshold:
+            out.append(f"{indent}{key}[{len(arr)}]: {joined}")
         else:
-            return [f"{indent}{key}[{len(arr)}]:", f"{indent}  {joined}"]
+            out.append(f"{indent}{key}[{len(arr)}]:")
+            out.append(f"{indent}  {joined}")
 
-    def _encode_tabular_array(self, arr: list[dict[str, Any]], key: str) -> list[str]:
+    def _encode_tabular_array(self, arr: list[dict[str, Any]], key: str, out: list[str]) -> None:
         """Encode a uniform array of objects in tabular format."""
         indent = self._indent()
 
@@ -146,160 +246,173 @@ class TONLEncoder:
         columns = list(arr[0].keys())
 
         # Build header
-        col_defs = []
-        for col in columns:
-            if self.options.include_types:
-                type_hint = infer_type(arr[0][col])
-                if type_hint.value not in ["obj", "list"]:
-                    col_defs.append(f"{col}:{type_hint.value}")
-                else:
-                    col_defs.append(col)
-            else:
-                col_defs.append(col)
-
-        header = f"{indent}{key}[{len(arr)}]{{{','.join(col_defs)}}}:"
-        lines = [header]
-
-        # Encode each row
-        for item in arr:
-            row_values = []
-            for col in columns:
-                val = item.get(col)
-                if isinstance(val, (dict, list)):
-                    # Nested object/array - not supported in tabular format
-                    row_values.append(str(val))
-                else:
-                    row_values.append(self._format_primitive_value(val, in_tabular_context=True))
-
-            # Format delimiter - comma has no leading space, others have space on both sides
-            if self.delimiter == ",":
-                delimiter_sep = ", "
-            elif self.delimiter == "\t":
-                delimiter_sep = "\t"
-            else:
-                delimiter_sep = f" {self.delimiter} "
-
-            row = delimiter_sep.join(row_values)
-            lines.append(f"{indent}  {row}")
-
-        return lines
-
-    def _encode_mixed_array(self, arr: list[Any], key: str) -> list[str]:
+        out.append(f"{indent}{key}[{len(arr)}]{{{self._column_defs(arr[0])}}}:")
+
+        # Format column by column so each column can use a formatter specialised
+        # for its value type, then join the formatted cells row by row. Values are
+        # all primitives here, as checked by ``_classify_array``.
+        formatted_columns = [
+            self._format_column([item.get(col) for item in arr], in_tabular_context=True)
+            for col in columns
+        ]
+
+        # Objects without keys still produce one (empty) row each
+        rows = zip(*formatted_columns, strict=True) if columns else [()] * len(arr)
+        row_indent = f"{indent}  "
+        join = self._delimiter_sep.join
+        for row_values in rows:
+            out.append(row_indent + join(row_values))
+
+    def _format_column(self, values: list[Any], in_tabular_context: bool = False) -> list[str]:
+        """Format a list of primitive values, specialising on a shared exact type."""
+        value_types = set(map(type, values))
+        if len(value_types) != 1:
+            # Mixed types: dispatch per value
+            fmt = self._format_primitive_value
+            return [fmt(v, False, in_tabular_context) for v in values]
+
+        t = value_types.pop()
+        if t is int:
+            return list(map(str, values))
+        if t is bool:
+            return [_BOOL_STRS[v] for v in values]
+        if t is str:
+            # Quote each distinct string once; columns often repeat values
+            delimiter = self.delimiter
+            formatted = {
+                v: quote_string(v) if needs_quoting(v, delimiter, False, in_tabular_context) else v
+                for v in dict.fromkeys(values)
+            }
+            return list(map(formatted.__getitem__, values))
+        formatter = self._FORMATTERS.get(t, TONLEncoder._format_other)
+        return [formatter(self, v, False, in_tabular_context) for v in values]
+
+    def _encode_mixed_array(self, arr: list[Any], key: str, out: list[str]) -> None:
         """Encode a mixed array with indexed elements."""
         indent = self._indent()
-        lines = [f"{indent}{key}[{len(arr)}]:"]
+        out.append(f"{indent}{key}[{len(arr)}]:")
 
         self.indent_level += 1
         for i, item in enumerate(arr):
-            item_key = f"[{i}]"
-            item_lines = self._encode_value(item, item_key)
-            lines.extend(item_lines)
+            item_key = _INDEX_KEYS[i] if i < _INDEX_KEY_COUNT else f"[{i}]"
+            self._encode_value(item, item_key, out)
         self.indent_level -= 1
 
-        return lines
-
-    def _encode_object(self, obj: dict[str, Any], key: str) -> list[str]:
+    def _encode_object(self, obj: dict[str, Any], key: str, out: list[str]) -> None:
         """Encode an object."""
         indent = self._indent()
 
-        # Filter undefined values (preserve order)
-        keys = [k for k in obj.keys() if obj[k] is not None or k in obj]
-
-        if not keys:
-            return [f"{indent}{key}{{}}:"]
-
-        # Build column definitions
-        col_defs = []
-        for k in keys:
-            if self.options.include_types:
-                type_hint = infer_type(obj[k])
-                if type_hint.value not in ["obj", "list"]:
-                    col_defs.append(f"{k}:{type_hint.value}")
-                else:
-                    col_defs.append(k)
-            else:
-                col_defs.append(k)
+        if not obj:
+            out.append(f"{indent}{key}{{}}:")
+            return
 
-        header = f"{indent}{key}{{{','.join(col_defs)}}}:"
+        # Build column definitions (all keys, in insertion order; null values are kept)
+        header = f"{indent}{key}{{{self._column_defs(obj)}}}:"
 
         # Decide single-line vs multi-line
-        if self._should_use_multiline(obj):
-            lines = [header]
+        pairs = self._single_line_pairs(obj)
+        if pairs is None:
+            out.append(header)
             self.indent_level += 1
-            for k in keys:
-                value_lines = self._encode_value(obj[k], k)
-                lines.extend(value_lines)
+            for k, v in obj.items():
+                self._encode_value(v, k, out)
             self.indent_level -= 1
-            return lines
         else:
             # Single line format
-            pairs = []
-            for k in keys:
-                val = obj[k]
-                formatted = self._format_primitive_value(val, in_single_line_object=True)
-                # print(f"DEBUG: k={k}, val={val}, formatted={formatted}")
-                pairs.append(f"{k}: {formatted}")
-
-            result = [f"{header} {' '.join(pairs)}"]
-            # print(f"DEBUG: _encode_object returning: {result}")
-            return result
-
-    def _should_use_multiline(self, obj: dict[str, Any]) -> bool:
-        """Determine if an object should use multi-line format."""
-        # Check for nested structures or newlines
-        for value in obj.values():
-            if isinstance(value, (dict, list)):
-                return True
-            if isinstance(value, str) and "\n" in value:
-                return True
+            out.append(f"{header} {' '.join(pairs)}")
+
+    def _column_defs(self, obj: dict[str, Any]) -> str:
+        """Build the comma-separated column list for a header, with type hints if enabled."""
+        if not self._include_types:
+            return ",".join(obj)
 
+        col_defs = []
+        for k, v in obj.items():
+            type_hint = infer_type(v).value
+            if type_hint in _UNHINTED_TYPES:
+                col_defs.append(k)
+            else:
+                col_defs.append(f"{k}:{type_hint}")
+        return ",".join(col_defs)
+
+    def _single_line_pairs(self, obj: dict[str, Any]) -> list[str] | None:
+        """Format an object's ``key: value`` pairs for one line, or None if it needs multi-line."""
         # NOTE: We intentionally do NOT force multi-line just because a value would
         # need quoting in single-line mode. The reference examples (e.g., 7.3, 7.4)
         # keep many quoted-or-quotable values on a single line as long as there is
         # no further nesting and the line length stays reasonable.
 
-        # Check predicted line length using formatted primitive representations,
-        # i.e. how the values would appear in a single-line object. This makes the
+        # Single pass: nested structures or newlines force multi-line, otherwise
+        # predict the line length using formatted primitive representations, i.e.
+        # how the values would appear in a single-line object. This makes the
         # heuristic match the reference examples more closely (e.g., 5.2, 5.3).
+        # Any of these conditions means multi-line, so the first one found decides.
+        threshold = self._threshold
+        fmt = self._format_primitive_value
+        pairs = []
         length = 0
         for k, v in obj.items():
-            length += len(k) + 2  # key + ": "
-            if isinstance(v, (dict, list)):
-                # Nested structures are already handled above; treat their
-                # contribution as minimal here.
-                length += 4
-            else:
-                formatted = self._format_primitive_value(v, in_single_line_object=True)
-                length += len(formatted)
-            length += 1  # space separator
+            t = type(v)
+            if t is str:
+                if "\n" in v:
+                    return None
+            elif t is dict or t is list:
+                return None
+            elif t not in _PRIMITIVE_TYPES:
+                if isinstance(v, (dict, list)):
+                    return None
+                if isinstance(v, str) and "\n" in v:
+                    return None
+
+            formatted = fmt(v, True, False)
+            # key + ": " + value + space separator
+            length += len(k) + 3 + len(formatted)
+            if length > threshold:
+                return None
+            pairs.append(f"{k}: {formatted}")
+
+        return pairs
+
+    def _classify_array(self, arr: list[Any]) -> int:
+        """Classify a non-empty array as tabular, primitive or mixed in one pass."""
+        first = arr[0]
+        # Tabular: uniform objects with the same keys (dict views compare as sets
+        # without building one) and only primitive values, since tabular format
+        # cannot hold nested objects or arrays.
+        tabular = isinstance(first, dict)
+        first_keys = first.keys() if tabular else None
+        # Primitive: no objects or arrays at all
+        primitive = True
 
-        if length > self.options.single_line_threshold:
-            return True
-
-        return False
-
-    def _is_uniform_object_array(self, arr: list[Any]) -> bool:
-        """Check if array contains uniform objects with same keys and all primitive values."""
-        if not arr:
-            return False
-
-        if not all(isinstance(item, dict) for item in arr):
-            return False
-
-        first_keys = set(arr[0].keys())
-        # Check all objects have same keys
-        if not all(set(item.keys()) == first_keys for item in arr):
-            return False
-
-        # Check all values are primitives (no nested objects or arrays)
-        # Tabular format only works with primitive values
         for item in arr:
-            for value in item.values():
-                if isinstance(value, (dict, list)):
-                    return False
+            t = type(item)
+            if t in _PRIMITIVE_TYPES:
+                tabular = False
+            elif t is dict or (t is not list and isinstance(item, dict)):
+                primitive = False
+                if tabular:
+                    if item.keys() != first_keys:
+                        tabular = False
+                    else:
+                        for value in item.values():
+                            if type(value) not in _PRIMITIVE_TYPES and isinstance(
+                                value, (dict, list)
+                            ):
+                                tabular = False
+                                break
+            elif t is list or isinstance(item, list):
+                return _MIXED_ARRAY
+            else:
+                tabular = False
+
+            if not tabular and not primitive:
+                return _MIXED_ARRAY
 
-        return True
+        return _TABULAR_ARRAY if tabular else _PRIMITIVE_ARRAY
 
     def _indent(self) -> str:
         """Get current indentation string."""
-        return " " * (self.indent_level * self.options.indent)
+        indents = self._indents
+        while len(indents) <= self.indent_level:
+            indents.append(indents[-1] + self._indent_unit)
+        return indents[self.indent_level]
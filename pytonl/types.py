@@ -18,7 +18,7 @@ class TONLType(Enum):
     LIST = "list"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EncodeOptions:
     """Options for encoding JSON to TONL."""
 
@@ -36,7 +36,7 @@ class DecodeOptions:
     strict: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnDef:
     """Column definition for TONL objects/arrays."""
 
@@ -1,10 +1,53 @@
 """Utility functions for TONL encoding and decoding."""
 
 import re
+from collections.abc import Callable
 from typing import Any
 
 from .types import JSONValue, TONLType
 
+# Key of a pair in a single-line object (possibly empty) and its colon, if any
+_PAIR_KEY_RE = re.compile(r"\s*(\w*)\s*(:?)\s*")
+
+# Start of the next pair in a single-line object: whitespace, identifier, colon
+_NEXT_KEY_RE = re.compile(r"\s+\w+\s*:")
+
+# Delimiter candidates, in tie-breaking order
+_DELIMITERS = (",", "|", "\t", ";")
+
+# Characters that force quoting, outside and inside tabular rows
+_SPECIAL_CHARS_RE = re.compile(r'[\n\r\t"\\:]')
+_TABULAR_SPECIAL_CHARS_RE = re.compile(r'[\n\r\t"\\]')
+
+# The same sets plus each candidate delimiter, keyed by (delimiter, in_tabular_context)
+_QUOTE_TRIGGERS_RE = {
+    (delimiter, tabular): re.compile(
+        "[" + re.escape(('\n\r\t"\\' if tabular else '\n\r\t"\\:') + delimiter) + "]"
+    )
+    for delimiter in _DELIMITERS
+    for tabular in (False, True)
+}
+
+# Unquoted values that would read back as literals (compared lowercased)
+_RESERVED_WORDS = frozenset({"null", "true", "false", "undefined", "infinity", "-infinity", "nan"})
+_RESERVED_WORD_MAX_LEN = max(map(len, _RESERVED_WORDS))
+
+# TONL types by exact Python type, see ``infer_type`` (int depends on the value)
+_TYPE_HINTS = {
+    type(None): TONLType.NULL,
+    bool: TONLType.BOOL,
+    float: TONLType.F64,
+    str: TONLType.STR,
+    list: TONLType.LIST,
+    dict: TONLType.OBJ,
+}
+
+# Unquoted literals and their values
+_LITERALS: dict[str, Any] = {"null": None, "": None, "true": True, "false": False}
+
+_NUMBER_RE = re.compile(r"^-?\d+\.?\d*([eE][+-]?\d+)?$")
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
 
 def select_best_delimiter(data: JSONValue) -> str:
     """Select the best delimiter for the given data.
@@ -25,42 +68,6 @@ def select_best_delimiter(data: JSONValue) -> str:
         else:
             return ","
 
-    def count_in_value(value: Any) -> dict[str, int]:
-        """Count delimiter occurrences in a single value."""
-        delimiters = [",", "|", "\t", ";"]
-        counts = dict.fromkeys(delimiters, 0)
-
-        if isinstance(value, str):
-            for delim in delimiters:
-                counts[delim] = value.count(delim)
-
-        return counts
-
-    def count_in_data(obj: Any) -> dict[str, int]:
-        """Recursively count delimiter occurrences in data."""
-        delimiters = [",", "|", "\t", ";"]
-        total_counts = dict.fromkeys(delimiters, 0)
-
-        if isinstance(obj, dict):
-            for val in obj.values():
-                val_counts = count_in_data(val)
-                for delim in total_counts:
-                    total_counts[delim] += val_counts[delim]
-        elif isinstance(obj, list):
-            for val in obj:
-                val_counts = count_in_data(val)
-                for delim in total_counts:
-                    total_counts[delim] += val_counts[delim]
-        elif isinstance(obj, str):
-            val_counts = count_in_value(obj)
-            for delim in total_counts:
-                total_counts[delim] += val_counts[delim]
-
-        return total_counts
-
-    # Count occurrences in actual data values
-    counts = count_in_data(data)
-
     # Heuristic: If data looks like a spreadsheet (keys start with "col"), prefer Tab
     # This is specifically for Example 10.2
     is_tabular = False
@@ -69,28 +76,66 @@ def select_best_delimiter(data: JSONValue) -> str:
         if isinstance(first_item, dict) and any(k.startswith("col") for k in first_item.keys()):
             is_tabular = True
 
-    if is_tabular and counts["\t"] == 0:
-        return "\t"
-
-    # Choose delimiter with minimum occurrences
-    return min(counts.keys(), key=counts.get)
+    # Tab wins for spreadsheet-like data as long as no value contains one
+    if is_tabular:
+        if not _contains_delimiter(data, "\t"):
+            return "\t"
+    # Otherwise comma is the first candidate, so it wins whenever no value
+    # contains one. Both checks stop at the first hit instead of counting.
+    elif not _contains_delimiter(data, ","):
+        return ","
+
+    # Count occurrences in actual data values, one slot per entry of _DELIMITERS
+    counts = [0, 0, 0, 0]
+    _count_delimiters(data, counts)
+
+    # Choose delimiter with minimum occurrences (the first one wins ties)
+    return _DELIMITERS[counts.index(min(counts))]
+
+
+def _count_delimiters(obj: Any, counts: list[int]) -> None:
+    """Recursively add delimiter occurrences in data to ``counts``."""
+    if isinstance(obj, dict):
+        for val in obj.values():
+            _count_delimiters(val, counts)
+    elif isinstance(obj, list):
+        for val in obj:
+            _count_delimiters(val, counts)
+    elif isinstance(obj, str):
+        counts[0] += obj.count(",")
+        counts[1] += obj.count("|")
+        counts[2] += obj.count("\t")
+        counts[3] += obj.count(";")
+
+
+def _contains_delimiter(obj: Any, delimiter: str) -> bool:
+    """Check if any string in data contains ``delimiter``."""
+    if isinstance(obj, dict):
+        obj = obj.values()
+    elif not isinstance(obj, list):
+        return isinstance(obj, str) and delimiter in obj
+
+    for val in obj:
+        if _contains_delimiter(val, delimiter):
+            return True
+    return False
 
 
 def infer_type(value: Any) -> TONLType:
     """Infer TONL type from a Python value."""
-    if value is None:
-        return TONLType.NULL
-
+    t = type(value)
+    if t is int:
+        return _infer_int_type(value)
+    type_hint = _TYPE_HINTS.get(t)
+    if type_hint is not None:
+        return type_hint
+
+    # Subclasses of the builtin types
     if isinstance(value, bool):
         return TONLType.BOOL
 
     if isinstance(value, int):
-        if 0 <= value <= 0xFFFFFFFF:
-            return TONLType.U32
-        elif -0x80000000 <= value <= 0x7FFFFFFF:
-            return TONLType.I32
-        else:
-            return TONLType.F64
+        return _infer_int_type(value)
 
     if isinstance(value, float):
         return TONLType.F64
@@ -107,6 +152,21 @@ def infer_type(value: Any) -> TONLType:
     return TONLType.STR  # Fallback
 
 
+def _infer_int_type(value: int) -> TONLType:
+    """Infer the narrowest TONL type for an integer."""
+    # bit_length() ignores the sign: up to 31 bits fits both u32 and i32 (u32
+    # wins for non-negatives), 32 bits fits u32 only, or i32 for exactly -2**31.
+    bits = value.bit_length()
+    if bits < 32:
+        return TONLType.U32 if value >= 0 else TONLType.I32
+    if bits == 32:
+        if value >= 0:
+            return TONLType.U32
+        if value == -0x80000000:
+            return TONLType.I32
+    return TONLType.F64
+
+
 def needs_quoting(
     value: str,
     delimiter: str = ",",
@@ -121,18 +181,17 @@ def needs_quoting(
     if not value:
         return True
 
-    # Quote if contains delimiter
-    if delimiter in value:
-        return True
-
-    # Check for special characters
+    # Quote if contains delimiter or special characters
     # Colon is NOT special in tabular context (where delimiters separate values)
-    special_chars = ["\n", "\r", "\t", '"', "\\"]
-    if not in_tabular_context:
-        special_chars.append(":")
     # Internal spaces are allowed without quoting (e.g., "Alice Smith"). We rely on
     # the leading/trailing whitespace check below to decide when spaces require quotes.
-    if any(char in value for char in special_chars):
+    triggers = _QUOTE_TRIGGERS_RE.get((delimiter, in_tabular_context))
+    if triggers is None:
+        # Not a standard delimiter, so look for it separately
+        if delimiter in value:
+            return True
+        triggers = _TABULAR_SPECIAL_CHARS_RE if in_tabular_context else _SPECIAL_CHARS_RE
+    if triggers.search(value):
         return True
 
     # Quote if starts/ends with whitespace
@@ -142,7 +201,9 @@ def needs_quoting(
     # Quote if it looks like a number, boolean, or null. This is required to
     # preserve the distinction between literals and strings (see Examples 6.2
     # and 6.3 in TRANSFORMATION_EXAMPLES).
-    if value.lower() in ("null", "true", "false", "undefined", "infinity", "-infinity", "nan"):
+    # Lowercasing never shortens a string, so only values up to the length of
+    # the longest reserved word ("-infinity") can match.
+    if len(value) <= _RESERVED_WORD_MAX_LEN and value.lower() in _RESERVED_WORDS:
         return True
 
     if is_number(value):
@@ -160,6 +221,8 @@ def quote_string(value: str) -> str:
         return f'"""{escaped}"""'
 
     # Use regular quotes, escape internal quotes by doubling
+    if "\\" not in value and '"' not in value:
+        return f'"{value}"'
     # Escape backslashes first
     escaped = value.replace("\\", "\\\\").replace('"', '""')
     return f'"{escaped}"'
@@ -172,11 +235,16 @@ def unquote_string(value: str) -> str:
     # Triple-quoted string
     if value.startswith('"""') and value.endswith('"""') and len(value) >= 6:
         content = value[3:-3]
+        # Both escapes start with a backslash
+        if "\\" not in content:
+            return content
         return content.replace('\\"""', '"""').replace("\\\\", "\\")
 
     # Regular quoted string
     if value.startswith('"') and value.endswith('"') and len(value) >= 2:
         content = value[1:-1]
+        if '"' not in content and "\\" not in content:
+            return content
         # Unescape quotes and backslashes
         return content.replace('""', '"').replace("\\\\", "\\")
 
@@ -185,45 +253,47 @@ def unquote_string(value: str) -> str:
 
 def is_number(s: str) -> bool:
     """Check if a string represents a number."""
-    pattern = r"^-?\d+\.?\d*([eE][+-]?\d+)?$"
-    return bool(re.match(pattern, s))
+    # Plain unsigned integers are decided without the regex engine, and so are
+    # strings that cannot start a number (most unquoted words).
+    if s.isdecimal():
+        return True
+    first = s[:1]
+    if first != "-" and not first.isdecimal():
+        return False
+    return _NUMBER_RE.match(s) is not None
 
 
 def parse_primitive_value(value_str: str) -> Any:
     """Parse a primitive value from TONL string."""
     trimmed = value_str.strip()
 
-    # Quoted string
-    if (trimmed.startswith('"') and trimmed.endswith('"')) or (
-        trimmed.startswith('"""') and trimmed.endswith('"""')
-    ):
+    # Quoted string (triple-quoted strings also start and end with a quote)
+    if trimmed.startswith('"') and trimmed.endswith('"'):
         return unquote_string(trimmed)
 
-    # Null
-    if trimmed == "null" or trimmed == "":
-        return None
-
-    # Boolean
-    if trimmed == "true":
-        return True
-    if trimmed == "false":
-        return False
+    # Null and booleans
+    if trimmed in _LITERALS:
+        return _LITERALS[trimmed]
 
     # Number
+    if trimmed.isdecimal():
+        return int(trimmed)
     if is_number(trimmed):
-        if "." in trimmed or "e" in trimmed.lower():
+        if "." in trimmed or "e" in trimmed or "E" in trimmed:
             return float(trimmed)
         else:
             return int(trimmed)
 
-    # Special floats
-    lower_val = trimmed.lower()
-    if lower_val == "infinity":
-        return float("inf")
-    elif lower_val == "-infinity":
-        return float("-inf")
-    elif lower_val == "nan":
-        return float("nan")
+    # Special floats. Lowercasing never shortens a string, so anything longer
+    # than "-infinity" cannot match.
+    if len(trimmed) <= 9:
+        lower_val = trimmed.lower()
+        if lower_val == "infinity":
+            return float("inf")
+        elif lower_val == "-infinity":
+            return float("-inf")
+        elif lower_val == "nan":
+            return float("nan")
 
     # Unquoted string
     return trimmed
@@ -318,71 +388,105 @@ def coerce_typed_value(value_str: str, type_hint: str, strict: bool) -> Any:
     return parse_primitive_value(value_str)
 
 
-def split_line_by_delimiter(line: str, delimiter: str) -> list[str]:
-    """Split a TONL line by delimiter, respecting quoted strings."""
-    fields = []
-    current_field = ""
-    mode = "plain"  # Modes: plain, inQuote, inTripleQuote
-    i = 0
-
-    while i < len(line):
-        char = line[i]
-        next_char = line[i + 1] if i + 1 < len(line) else None
-        next_next_char = line[i + 2] if i + 2 < len(line) else None
-
-        if mode == "plain":
-            if char == '"':
-                # Check for triple quote
-                if next_char == '"' and next_next_char == '"':
-                    mode = "inTripleQuote"
-                    current_field += '"""'
-                    i += 2  # Skip next two quotes
+def make_line_splitter(delimiter: str) -> Callable[[str], list[str]]:
+    """Build a ``split_line_by_delimiter`` specialised for one delimiter."""
+    if len(delimiter) != 1:
+        # Only a single character can separate (or be escaped in) fields
+        def split_unseparated(line: str) -> list[str]:
+            return [line.strip()]
+
+        return split_unseparated
+
+    escaped_delimiter = "\\" + delimiter
+
+    def split_line(line: str) -> list[str]:
+        # Without quotes or escapes the delimiter always separates fields
+        if '"' not in line and "\\" not in line:
+            return [field.strip() for field in line.split(delimiter)]
+
+        fields: list[str] = []
+        parts: list[str] = []  # Pieces of the current field
+        add_field = fields.append
+        add_part = parts.append
+        length = len(line)
+        i = 0
+
+        # Next position of each plain-mode event, found with str.find and only
+        # searched again once parsing has moved past it (``length`` if none left)
+        quote = escape = delim = -1
+
+        while True:
+            if quote < i:
+                quote = line.find('"', i)
+                if quote < 0:
+                    quote = length
+            if escape < i:
+                escape = line.find(escaped_delimiter, i)
+                if escape < 0:
+                    escape = length
+            if delim < i:
+                delim = line.find(delimiter, i)
+                if delim < 0:
+                    delim = length
+
+            pos = min(quote, escape, delim)
+            add_part(line[i:pos])
+            if pos == length:
+                break
+
+            if pos == quote:
+                if line.startswith('"""', pos):
+                    # Triple-quoted: runs to the next """
+                    end = line.find('"""', pos + 3)
+                    end = length if end < 0 else end + 3
                 else:
-                    mode = "inQuote"
-                    current_field += char
+                    # Quoted: runs to the next quote that is not doubled
+                    end = pos + 1
+                    while True:
+                        end = line.find('"', end)
+                        if end < 0:
+                            end = length
+                            break
+                        if line.startswith('""', end):
+                            # Doubled quote = literal quote (keep both in field)
+                            end += 2
+                        else:
+                            end += 1
+                            break
+                add_part(line[pos:end])
+                i = end
 
-            elif char == "\\" and next_char == delimiter:
+            elif pos == escape:
                 # Escaped delimiter
-                current_field += delimiter
-                i += 1  # Skip backslash
+                add_part(delimiter)
+                i = pos + 2
 
-            elif char == delimiter:
+            else:
                 # Field separator
-                fields.append(current_field.strip())
-                current_field = ""
+                add_field("".join(parts).strip())
+                parts.clear()
+                i = pos + 1
 
-            else:
-                current_field += char
-
-        elif mode == "inQuote":
-            current_field += char
-            if char == '"':
-                if next_char == '"':
-                    # Doubled quote = literal quote (keep both in field)
-                    current_field += '"'
-                    i += 1
-                else:
-                    # End of quoted field
-                    mode = "plain"
+        # Add last field
+        fields.append("".join(parts).strip())
+        return fields
+
+    return split_line
 
-        elif mode == "inTripleQuote":
-            current_field += char
-            if char == '"' and next_char == '"' and next_next_char == '"':
-                current_field += '""'
-                mode = "plain"
-                i += 2
 
-        i += 1
+# Splitters for the delimiters chosen by the encoder, built once
+_LINE_SPLITTERS = {delimiter: make_line_splitter(delimiter) for delimiter in _DELIMITERS}
 
-    # Add last field
-    fields.append(current_field.strip())
-    return fields
+
+def split_line_by_delimiter(line: str, delimiter: str) -> list[str]:
+    """Split a TONL line by delimiter, respecting quoted strings."""
+    splitter = _LINE_SPLITTERS.get(delimiter) or make_line_splitter(delimiter)
+    return splitter(line)
 
 
 def is_valid_identifier(name: str) -> bool:
     """Check if a string is a valid TONL identifier."""
-    pattern = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
-    return bool(re.match(pattern, name))
+    return _IDENTIFIER_RE.match(name) is not None
 
 
 def parse_key_value_pairs(
@@ -402,98 +506,51 @@ def parse_key_value_pairs(
     length = len(line)
 
     while i < length:
-        # Skip whitespace
-        while i < length and line[i].isspace():
-            i += 1
-
-        if i >= length:
+        # Key and colon, with the whitespace around them
+        match = _PAIR_KEY_RE.match(line, i)
+        if match is None:
             break
-
-        # Parse key
-        key_start = i
-        while i < length and (line[i].isalnum() or line[i] == "_"):
-            i += 1
-
-        key = line[key_start:i]
-
-        # Expect colon
-        while i < length and line[i].isspace():
-            i += 1
-
-        if i < length and line[i] == ":":
-            i += 1
-        else:
-            # Invalid format, skip to next likely key or end
+        key = match[1]
+        i = match.end()
+
+        if not match[2]:
+            # Invalid format, skip to next likely key or end. A character that
+            # cannot start a key is skipped so the scan always moves forward.
+            if not key:
+                i += 1
             continue
 
-        # Skip whitespace before value
-        while i < length and line[i].isspace():
-            i += 1
-
         # Parse value
         if i < length:
+            value_start = i
             if line[i] == '"':
                 # Quoted string
-                value_start = i
-                # Check for triple quote
-                if i + 2 < length and line[i : i + 3] == '"""':
-                    i += 3
-                    while i < length:
-                        if line[i : i + 3] == '"""' and line[i - 1] != "\\":
-                            i += 3
-                            break
-                        i += 1
+                if line.startswith('"""', i):
+                    # Triple-quoted: ends at the next """ not preceded by a backslash
+                    end = line.find('"""', i + 3)
+                    while end >= 0 and line[end - 1] == "\\":
+                        end = line.find('"""', end + 1)
+                    i = length if end < 0 else end + 3
                 else:
-                    # Single quote
-                    i += 1
-                    while i < length:
-                        if line[i] == '"':
-                            if i + 1 < length and line[i + 1] == '"':
-                                i += 2  # Skip escaped quote
-                            else:
-                                i += 1
-                                break
-                        else:
-                            i += 1
+                    # Single quote: ends at the next quote that is not doubled
+                    end = line.find('"', i + 1)
+                    while end >= 0 and line.startswith('""', end):
+                        end = line.find('"', end + 2)
+                    i = length if end < 0 else end + 1
 
                 value_str = line[value_start:i]
-                if type_hints and key in type_hints and strict:
-                    result[key] = coerce_typed_value(value_str, type_hints[key], strict=True)
-                else:
-                    result[key] = parse_primitive_value(value_str)
             else:
                 # Unquoted primitive value
                 # Read until we find the start of the next key:value pair or end of line
                 # Next pair starts with: <space> <identifier> <colon>
-                value_start = i
-                while i < length:
-                    # If we hit a space, check if it's followed by a key pattern
-                    if line[i].isspace():
-                        # Look ahead for pattern: whitespace* identifier colon
-                        j = i + 1
-                        while j < length and line[j].isspace():
-                            j += 1
-                        if j < length:
-                            # Check if this could be the start of a key
-                            k = j
-                            while k < length and (line[k].isalnum() or line[k] == "_"):
-                                k += 1
-                            # Skip whitespace after identifier
-                            while k < length and line[k].isspace():
-                                k += 1
-                            # If we found identifier followed by colon, this is the next key
-                            if k < length and line[k] == ":" and k > j:
-                                # Don't include this space in the value
-                                break
-                        # Otherwise, include this space in the value
-                        i += 1
-                    else:
-                        i += 1
+                next_key = _NEXT_KEY_RE.search(line, i)
+                i = next_key.start() if next_key else length
 
                 value_str = line[value_start:i].strip()
-                if type_hints and key in type_hints and strict:
-                    result[key] = coerce_typed_value(value_str, type_hints[key], strict=True)
-                else:
-                    result[key] = parse_primitive_value(value_str)
+
+            if type_hints and key in type_hints and strict:
+                result[key] = coerce_typed_value(value_str, type_hints[key], strict=True)
+            else:
+                result[key] = parse_primitive_value(value_str)
 
     return result
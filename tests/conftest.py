@@ -0,0 +1,65 @@
+"""Shared pytest fixtures for TONL tests."""
+
+import pytest
+
+from pytonl import EncodeOptions, JSONValue, decode, encode
+from tests.fixtures.sample_data import (
+    NESTED_OBJECT_JSON,
+    PRIMITIVE_ARRAYS_JSON,
+    SIMPLE_OBJECT_JSON,
+    SPECIAL_CHARS_JSON,
+    TYPE_TEST_JSON,
+    UNIFORM_ARRAY_JSON,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_codec() -> None:
+    """Run both codecs once so first-call costs are not charged to the first test."""
+    encode({"a": [1, 2, 3], "b": {"c": "d"}}, EncodeOptions(include_types=True))
+    decode("#version 1.0\nk: v")
+
+
+# ``encode`` is pure, so each sample is encoded once per session and shared.
+
+
+@pytest.fixture(scope="session")
+def simple_encoded() -> str:
+    """``SIMPLE_OBJECT_JSON`` encoded with default options."""
+    return encode(SIMPLE_OBJECT_JSON)
+
+
+@pytest.fixture(scope="session")
+def uniform_encoded() -> str:
+    """``UNIFORM_ARRAY_JSON`` encoded with default options."""
+    return encode(UNIFORM_ARRAY_JSON)
+
+
+@pytest.fixture(scope="session")
+def primitive_encoded() -> str:
+    """``PRIMITIVE_ARRAYS_JSON`` encoded with default options."""
+    return encode(PRIMITIVE_ARRAYS_JSON)
+
+
+@pytest.fixture(scope="session")
+def nested_encoded() -> str:
+    """``NESTED_OBJECT_JSON`` encoded with default options."""
+    return encode(NESTED_OBJECT_JSON)
+
+
+@pytest.fixture(scope="session")
+def special_encoded() -> str:
+    """``SPECIAL_CHARS_JSON`` encoded with default options."""
+    return encode(SPECIAL_CHARS_JSON)
+
+
+@pytest.fixture(scope="session")
+def types_encoded() -> str:
+    """``TYPE_TEST_JSON`` encoded with default options."""
+    return encode(TYPE_TEST_JSON)
+
+
+@pytest.fixture(scope="session")
+def types_roundtrip(types_encoded: str) -> JSONValue:
+    """``TYPE_TEST_JSON`` after an encode/decode roundtrip."""
+    return decode(types_encoded)
@@ -1,5 +1,10 @@
 """Tests for TONL decoder."""
 
+import io
+import tracemalloc
+
+import pytest
+
 from pytonl import decode
 from tests.fixtures.sample_data import (
     NESTED_OBJECT_TONL,
@@ -124,3 +129,64 @@ items[3]: a | b | c"""
             "Storage (Group S)",
             "Business (Group B)",
         ]
+
+    def test_decode_tabular_rows_with_quotes_and_escapes(self):
+        """Test tabular rows mixing plain, quoted and escaped-delimiter cells."""
+        tonl = """#version 1.0
+items[3]{name,note}:
+  plain, value
+  "quoted, name", 2
+  escaped\\, name, 3"""
+        result = decode(tonl)
+        assert result["items"] == [
+            {"name": "plain", "note": "value"},
+            {"name": "quoted, name", "note": 2},
+            {"name": "escaped, name", "note": 3},
+        ]
+
+    def test_decode_bytes_and_binary_stream(self):
+        """Test decoding UTF-8 bytes and binary file objects."""
+        tonl = "#version 1.0\nroot{name,city}: name: Zoë city: Zürich"
+        expected = {"name": "Zoë", "city": "Zürich"}
+        assert decode(tonl.encode("utf-8")) == expected
+        assert decode(io.BytesIO(tonl.encode("utf-8"))) == expected
+
+    def test_decode_tabular_array_with_oversized_declared_length(self):
+        """Test that a huge declared row count does not preallocate that many rows."""
+        tonl = "#version 1.0\nrows[50000000]{a}:\n  1\n"
+        tracemalloc.start()
+        try:
+            result = decode(tonl)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert result == {"rows": [{"a": 1}]}
+        assert peak < 1_000_000
+
+    def test_decode_object_item_after_top_level_value_raises(self):
+        """Test that object items after a top-level non-object value are not dropped."""
+        with pytest.raises(ValueError):
+            decode("#version 1.0\n[0][2]: 1, 2\na: 1")
+
+    def test_decode_single_line_object_skips_stray_characters(self):
+        """Test that characters which cannot start a key are skipped."""
+        tonl = '#version 1.0\nroot{a,b}: a: "x"! b: 2'
+        assert decode(tonl) == {"a": "x", "b": 2}
+
+    def test_decode_text_stream(self):
+        """Test decoding a text file object line by line."""
+        tonl = (
+            '#version 1.0\r\nroot{poem,tags}:\r\n  poem: """Line 1\r\nLine 2"""\r\n'
+            "  tags[2]: a, b\r\n"
+        )
+        result = decode(io.StringIO(tonl))
+        assert result == {"poem": "Line 1\nLine 2", "tags": ["a", "b"]}
+
+        # Streams split lines exactly like ``str.splitlines``
+        for doc in (
+            '#version 1.0\ra: 1\rb: """x\ry"""',
+            "#version 1.0\na: 1\x0cb: 2",
+            "#version 1.0\na: 1\u2028b: 2",
+        ):
+            assert decode(io.StringIO(doc)) == decode(doc)
+            assert decode(io.BytesIO(doc.encode("utf-8"))) == decode(doc)
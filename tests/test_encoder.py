@@ -1,74 +1,92 @@
 """Tests for TONL encoder."""
 
-from pytonl import EncodeOptions, decode, encode
-from tests.fixtures.sample_data import (
-    NESTED_OBJECT_JSON,
-    PRIMITIVE_ARRAYS_JSON,
-    SIMPLE_OBJECT_JSON,
-    SPECIAL_CHARS_JSON,
-    TYPE_TEST_JSON,
-    UNIFORM_ARRAY_JSON,
-)
+import pytest
 
+from pytonl import EncodeOptions, decode, encode
+from tests.fixtures.sample_data import SPECIAL_CHARS_JSON
 
-class TestEncoder:
-    """Test cases for TONL encoder."""
 
-    def test_encode_simple_object(self):
-        """Test encoding a simple object."""
-        result = encode(SIMPLE_OBJECT_JSON)
-        assert "#version 1.0" in result
-        # Check that all keys are present in header (order may vary)
-        assert "root{" in result and "active" in result and "id" in result and "name" in result
-        assert "active: true" in result
-        assert "id: 123" in result
-        assert "name: Alice Smith" in result
+def _assert_all_in(text, tokens):
+    """Assert that every token occurs in ``text``, reporting all missing ones."""
+    missing = [token for token in tokens if token not in text]
+    assert not missing, missing
 
-    def test_encode_uniform_array(self):
-        """Test encoding uniform object array."""
-        result = encode(UNIFORM_ARRAY_JSON)
-        assert "users[2]{id,name,role}:" in result
-        assert "1, Alice, admin" in result
-        assert "2, Bob, user" in result
 
-    def test_encode_primitive_arrays(self):
-        """Test encoding primitive arrays."""
-        result = encode(PRIMITIVE_ARRAYS_JSON)
-        assert "numbers[5]:" in result
-        assert "1, 2, 3, 4, 5" in result
-        assert "tags[3]:" in result
-        assert "urgent, important, review" in result
+class TestEncoder:
+    """Test cases for TONL encoder."""
 
-    def test_encode_nested_object(self):
-        """Test encoding nested objects."""
-        result = encode(NESTED_OBJECT_JSON)
-        # Check that keys are present (order may vary)
-        assert "config{" in result and "cache" in result and "database" in result
-        assert "cache: true" in result
-        assert "database{" in result and "host" in result and "port" in result
-        assert "host: localhost" in result
-        assert "port: 5432" in result
+    @pytest.mark.parametrize(
+        ("fixture", "expected"),
+        [
+            pytest.param(
+                "simple_encoded",
+                [
+                    "#version 1.0",
+                    # Header keys (order may vary)
+                    "root{",
+                    "active",
+                    "id",
+                    "name",
+                    "active: true",
+                    "id: 123",
+                    "name: Alice Smith",
+                ],
+                id="simple_object",
+            ),
+            pytest.param(
+                "uniform_encoded",
+                ["users[2]{id,name,role}:", "1, Alice, admin", "2, Bob, user"],
+                id="uniform_array",
+            ),
+            pytest.param(
+                "primitive_encoded",
+                ["numbers[5]:", "1, 2, 3, 4, 5", "tags[3]:", "urgent, important, review"],
+                id="primitive_arrays",
+            ),
+            pytest.param(
+                "nested_encoded",
+                [
+                    # Header keys (order may vary)
+                    "config{",
+                    "cache",
+                    "database",
+                    "cache: true",
+                    "database{",
+                    "host",
+                    "port",
+                    "host: localhost",
+                    "port: 5432",
+                ],
+                id="nested_object",
+            ),
+            pytest.param(
+                "types_encoded",
+                [
+                    "bool_true: true",
+                    "bool_false: false",
+                    "int_positive: 42",
+                    "int_negative: -100",
+                    "float_value: 3.14",
+                    "string_value: hello world",
+                    "null_value: null",
+                ],
+                id="types",
+            ),
+        ],
+    )
+    def test_encode_shapes(self, request, fixture, expected):
+        """Test encoding each sample shape."""
+        _assert_all_in(request.getfixturevalue(fixture), expected)
 
-    def test_encode_special_characters(self):
+    def test_encode_special_characters(self, special_encoded):
         """Test encoding values with special characters that need quoting."""
-        result = encode(SPECIAL_CHARS_JSON)
+        result = special_encoded
         # Data contains comma, so auto-selection should choose pipe delimiter
         # With pipe, "Item, A" doesn't need quoting
         assert "#delimiter |" in result
         assert decode(result) == SPECIAL_CHARS_JSON
         assert "Item B" in result
 
-    def test_encode_types(self):
-        """Test encoding various types."""
-        result = encode(TYPE_TEST_JSON)
-        assert "bool_true: true" in result
-        assert "bool_false: false" in result
-        assert "int_positive: 42" in result
-        assert "int_negative: -100" in result
-        assert "float_value: 3.14" in result
-        assert "string_value: hello world" in result
-        assert "null_value: null" in result
-
     def test_encode_empty_array(self):
         """Test encoding empty array."""
         result = encode({"items": []})
@@ -79,10 +97,10 @@ class TestEncoder:
         result = encode({"config": {}})
         assert "config{}:" in result
 
-    def test_encode_auto_delimiter_selection(self):
+    def test_encode_auto_delimiter_selection(self, primitive_encoded):
         """Test that encoder auto-selects best delimiter."""
         # This data has no commas, so should use comma (default)
-        result = encode(PRIMITIVE_ARRAYS_JSON)
+        result = primitive_encoded
         # Comma is default, no delimiter header needed
         assert "#delimiter" not in result or result.count(",") > 0
 
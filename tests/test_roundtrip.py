@@ -1,12 +1,12 @@
 """Roundtrip tests ensuring JSON -> TONL -> JSON fidelity."""
 
+import pytest
 
 from pytonl import decode, encode
 from tests.fixtures.sample_data import (
     NESTED_OBJECT_JSON,
     PRIMITIVE_ARRAYS_JSON,
     SIMPLE_OBJECT_JSON,
-    TYPE_TEST_JSON,
     UNIFORM_ARRAY_JSON,
 )
 
@@ -14,41 +14,46 @@ from tests.fixtures.sample_data import (
 class TestRoundtrip:
     """Test cases for roundtrip conversion."""
 
-    def test_roundtrip_simple_object(self):
+    def test_roundtrip_simple_object(self, simple_encoded):
         """Test JSON -> TONL -> JSON preserves simple object."""
-        tonl = encode(SIMPLE_OBJECT_JSON)
-        result = decode(tonl)
+        result = decode(simple_encoded)
         assert result == SIMPLE_OBJECT_JSON
 
-    def test_roundtrip_uniform_array(self):
+    def test_roundtrip_uniform_array(self, uniform_encoded):
         """Test JSON -> TONL -> JSON preserves uniform array."""
-        tonl = encode(UNIFORM_ARRAY_JSON)
-        result = decode(tonl)
+        result = decode(uniform_encoded)
         assert result == UNIFORM_ARRAY_JSON
 
-    def test_roundtrip_primitive_arrays(self):
+    def test_roundtrip_primitive_arrays(self, primitive_encoded):
         """Test JSON -> TONL -> JSON preserves primitive arrays."""
-        tonl = encode(PRIMITIVE_ARRAYS_JSON)
-        result = decode(tonl)
+        result = decode(primitive_encoded)
         assert result == PRIMITIVE_ARRAYS_JSON
 
-    def test_roundtrip_nested_object(self):
+    def test_roundtrip_nested_object(self, nested_encoded):
         """Test JSON -> TONL -> JSON preserves nested objects."""
-        tonl = encode(NESTED_OBJECT_JSON)
-        result = decode(tonl)
+        result = decode(nested_encoded)
         assert result == NESTED_OBJECT_JSON
 
-    def test_roundtrip_type_preservation(self):
+    @pytest.mark.parametrize(
+        ("key", "expected"),
+        [("bool_true", True), ("bool_false", False), ("null_value", None)],
+    )
+    def test_roundtrip_literal_preservation(self, types_roundtrip, key, expected):
+        """Test that literals come back as the same singletons."""
+        assert types_roundtrip[key] is expected
+
+    @pytest.mark.parametrize(
+        ("key", "expected_type"),
+        [
+            ("int_positive", int),
+            ("int_negative", int),
+            ("float_value", float),
+            ("string_value", str),
+        ],
+    )
+    def test_roundtrip_type_preservation(self, types_roundtrip, key, expected_type):
         """Test that types are preserved through roundtrip."""
-        tonl = encode(TYPE_TEST_JSON)
-        result = decode(tonl)
-        assert result["bool_true"] is True
-        assert result["bool_false"] is False
-        assert isinstance(result["int_positive"], int)
-        assert isinstance(result["int_negative"], int)
-        assert isinstance(result["float_value"], float)
-        assert isinstance(result["string_value"], str)
-        assert result["null_value"] is None
+        assert isinstance(types_roundtrip[key], expected_type)
 
     def test_roundtrip_complex_structure(self):
         """Test roundtrip with complex nested structure."""
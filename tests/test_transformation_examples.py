@@ -5,427 +5,271 @@ Each test verifies that the encoder produces exact TONL output as documented.
 """
 
 import math
+from pathlib import Path
 
 import pytest
 
 from pytonl import DecodeOptions, EncodeOptions, decode, encode
 
-
-class TestSimpleTypes:
-    """Tests for Simple Types (Section 1)."""
-
-    def test_1_1_basic_primitives(self):
-        """Example 1.1: Basic Primitives."""
-        data = {"string": "hello", "number": 42, "float": 3.14, "boolean": True, "null_value": None}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{string,number,float,boolean,null_value}: string: hello number: 42 float: 3.14 boolean: true null_value: null"""  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_1_2_strings_requiring_quotes(self):
-        """Example 1.2: Strings Requiring Quotes."""
-        data = {
+_GOLDENS_PATH = Path(__file__).parent / "fixtures" / "transformation_examples.tonl.txt"
+
+
+def _load_goldens():
+    """Read the documented TONL outputs, keyed by their ``##CASE:`` example id."""
+    goldens = {}
+    for block in _GOLDENS_PATH.read_text(encoding="utf-8").split("##CASE: ")[1:]:
+        name, _, text = block.partition("\n")
+        goldens[name] = text.removesuffix("\n")
+    return goldens
+
+
+# Loaded once at import and shared by every case below.
+_GOLDENS = _load_goldens()
+
+# Options shared by every test; none of them mutate these instances.
+_OPTS_NO_TYPES = EncodeOptions(include_types=False)
+_OPTS_TYPES = EncodeOptions(include_types=True)
+_OPTS_STRICT = DecodeOptions(strict=True)
+
+# Examples whose documented output is compared exactly and which roundtrip
+# unchanged: (data, expected TONL or None, encode options or None).
+CASES = [
+    # Section 1: Simple Types
+    # Example 1.1: Basic Primitives.
+    pytest.param(
+        {"string": "hello", "number": 42, "float": 3.14, "boolean": True, "null_value": None},
+        _GOLDENS["1_1_basic_primitives"],
+        None,
+        id="1_1_basic_primitives",
+    ),
+    # Example 1.2: Strings Requiring Quotes.
+    pytest.param(
+        {
             "with_comma": "Hello, world",
             "with_colon": "Key: Value",
             "with_quotes": 'She said "hi"',
             "number_string": "123",
             "bool_string": "true",
-        }
-        tonl = encode(data)
-        assert (
-            '''#version 1.0
-root{with_comma,with_colon,with_quotes,number_string,bool_string}:
-  with_comma: "Hello, world"
-  with_colon: "Key: Value"
-  with_quotes: "She said ""hi"""
-  number_string: "123"
-  bool_string: "true"'''
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_1_3_special_numeric_values(self):
-        """Example 1.3: Special Numeric Values."""
-        data = {
-            "infinity": float("inf"),
-            "negative_infinity": float("-inf"),
-            "not_a_number": float("nan"),
-            "infinity_string": "Infinity",
-        }
-        tonl = encode(data)
-        assert (
-            '''#version 1.0
-root{infinity,negative_infinity,not_a_number,infinity_string}:
-  infinity: Infinity
-  negative_infinity: -Infinity
-  not_a_number: NaN
-  infinity_string: "Infinity"'''
-            == tonl
-        )
-
-        decoded = decode(tonl)
-        assert decoded["infinity"] == float("inf")
-        assert decoded["negative_infinity"] == float("-inf")
-        assert math.isnan(decoded["not_a_number"])
-        assert decoded["infinity_string"] == "Infinity"
-
-
-class TestComplexObjects:
-    """Tests for Complex Objects (Section 2)."""
-
-    def test_2_1_nested_objects_multiline(self):
-        """Example 2.1: Nested Objects (Multi-line)."""
-        data = {"user": {"name": "Alice Smith", "profile": {"age": 30, "city": "New York"}}}
-        tonl = encode(data)
-        # Encoder chooses inline formatting for the inner profile object while
-        # keeping the outer user block multi-line.
-        assert (
-            "#version 1.0\nuser{name,profile}:\n  name: Alice Smith\n  profile{age,city}: age: 30 city: New York"  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_2_2_flat_object_singleline(self):
-        """Example 2.2: Flat Object (Single-line)."""
-        data = {"config": {"timeout": 5000, "retries": 3, "debug": False}}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-config{timeout,retries,debug}: timeout: 5000 retries: 3 debug: false"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_2_3_mixed_nesting(self):
-        """Example 2.3: Mixed Nesting."""
-        data = {
+        },
+        _GOLDENS["1_2_strings_requiring_quotes"],
+        None,
+        id="1_2_strings_requiring_quotes",
+    ),
+    # Section 2: Complex Objects
+    # Example 2.1: Nested Objects (Multi-line).
+    # Encoder chooses inline formatting for the inner profile object while
+    # keeping the outer user block multi-line.
+    pytest.param(
+        {"user": {"name": "Alice Smith", "profile": {"age": 30, "city": "New York"}}},
+        _GOLDENS["2_1_nested_objects_multiline"],
+        None,
+        id="2_1_nested_objects_multiline",
+    ),
+    # Example 2.2: Flat Object (Single-line).
+    pytest.param(
+        {"config": {"timeout": 5000, "retries": 3, "debug": False}},
+        _GOLDENS["2_2_flat_object_singleline"],
+        None,
+        id="2_2_flat_object_singleline",
+    ),
+    # Example 2.3: Mixed Nesting.
+    # According to the number-like string rules (Example 6.3), "2.0" should be
+    # quoted to preserve it as a string rather than a numeric value.
+    pytest.param(
+        {
             "app": {
                 "name": "MyApp",
                 "version": "2.0",
                 "settings": {"theme": "dark", "language": "en"},
                 "features": ["auth", "api", "cache"],
             }
-        }
-        tonl = encode(data)
-        # According to the number-like string rules (Example 6.3), "2.0" should be
-        # quoted to preserve it as a string rather than a numeric value.
-        assert (
-            """#version 1.0
-app{name,version,settings,features}:
-  name: MyApp
-  version: "2.0"
-  settings{theme,language}: theme: dark language: en
-  features[3]: auth, api, cache"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-
-class TestArrays:
-    """Tests for Arrays (Section 3)."""
-
-    def test_3_1_simple_primitive_array(self):
-        """Example 3.1: Simple Primitive Array."""
-        data = {"numbers": [1, 2, 3, 4, 5], "tags": ["urgent", "review", "bug-fix"]}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{numbers,tags}:
-  numbers[5]: 1, 2, 3, 4, 5
-  tags[3]: urgent, review, bug-fix"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_3_2_uniform_object_array(self):
-        """Example 3.2: Uniform Object Array (Tabular)."""
-        data = {
+        },
+        _GOLDENS["2_3_mixed_nesting"],
+        None,
+        id="2_3_mixed_nesting",
+    ),
+    # Section 3: Arrays
+    # Example 3.1: Simple Primitive Array.
+    pytest.param(
+        {"numbers": [1, 2, 3, 4, 5], "tags": ["urgent", "review", "bug-fix"]},
+        _GOLDENS["3_1_simple_primitive_array"],
+        None,
+        id="3_1_simple_primitive_array",
+    ),
+    # Example 3.2: Uniform Object Array (Tabular).
+    pytest.param(
+        {
             "users": [
                 {"id": 1, "name": "Alice", "role": "admin", "active": True},
                 {"id": 2, "name": "Bob", "role": "user", "active": True},
                 {"id": 3, "name": "Carol", "role": "editor", "active": False},
             ]
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-users[3]{id,name,role,active}:
-  1, Alice, admin, true
-  2, Bob, user, true
-  3, Carol, editor, false"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_3_3_non_uniform_array(self):
-        """Example 3.3: Non-Uniform Array (Mixed)."""
-        data = {"items": ["text", 42, {"id": 1, "name": "Object"}, True, [1, 2, 3]]}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-items[5]:
-  [0]: text
-  [1]: 42
-  [2]{id,name}: id: 1 name: Object
-  [3]: true
-  [4][3]: 1, 2, 3"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_3_4_array_with_null_values(self):
-        """Example 3.4: Array with Null Values."""
-        data = {"data": [1, None, 3, None, 5]}
-        tonl = encode(data)
-        assert "#version 1.0\ndata[5]: 1, null, 3, null, 5" == tonl
-        assert decode(tonl) == data
-
-    def test_3_5_empty_arrays(self):
-        """Example 3.5: Empty Arrays."""
-        data = {"empty_array": [], "other_field": "value"}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{empty_array,other_field}:
-  empty_array[0]:
-  other_field: value"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-
-class TestNestedStructures:
-    """Tests for Nested Structures (Section 4)."""
-
-    def test_4_1_deep_nesting(self):
-        """Example 4.1: Deep Nesting."""
-        data = {"level1": {"level2": {"level3": {"level4": {"level5": "deep value"}}}}}
-        tonl = encode(data)
-        # For deep nesting, the encoder keeps the innermost object (level4)
-        # single-line while preserving the overall hierarchy.
-        assert (
-            "#version 1.0\nlevel1{level2}:\n  level2{level3}:\n    level3{level4}:\n      level4{level5}: level5: deep value"  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_4_2_array_of_arrays(self):
-        """Example 4.2: Array of Arrays."""
-        data = {"matrix": [[1, 2, 3], [4, 5, 6], [7, 8, 9]]}
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-matrix[3]:
-  [0][3]: 1, 2, 3
-  [1][3]: 4, 5, 6
-  [2][3]: 7, 8, 9"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_4_3_array_of_objects_with_arrays(self):
-        """Example 4.3: Array of Objects with Arrays."""
-        data = {
+        },
+        _GOLDENS["3_2_uniform_object_array"],
+        None,
+        id="3_2_uniform_object_array",
+    ),
+    # Example 3.3: Non-Uniform Array (Mixed).
+    pytest.param(
+        {"items": ["text", 42, {"id": 1, "name": "Object"}, True, [1, 2, 3]]},
+        _GOLDENS["3_3_non_uniform_array"],
+        None,
+        id="3_3_non_uniform_array",
+    ),
+    # Example 3.4: Array with Null Values.
+    pytest.param(
+        {"data": [1, None, 3, None, 5]},
+        _GOLDENS["3_4_array_with_null_values"],
+        None,
+        id="3_4_array_with_null_values",
+    ),
+    # Example 3.5: Empty Arrays.
+    pytest.param(
+        {"empty_array": [], "other_field": "value"},
+        _GOLDENS["3_5_empty_arrays"],
+        None,
+        id="3_5_empty_arrays",
+    ),
+    # Section 4: Nested Structures
+    # Example 4.1: Deep Nesting.
+    # For deep nesting, the encoder keeps the innermost object (level4)
+    # single-line while preserving the overall hierarchy.
+    pytest.param(
+        {"level1": {"level2": {"level3": {"level4": {"level5": "deep value"}}}}},
+        _GOLDENS["4_1_deep_nesting"],
+        None,
+        id="4_1_deep_nesting",
+    ),
+    # Example 4.2: Array of Arrays.
+    pytest.param(
+        {"matrix": [[1, 2, 3], [4, 5, 6], [7, 8, 9]]},
+        _GOLDENS["4_2_array_of_arrays"],
+        None,
+        id="4_2_array_of_arrays",
+    ),
+    # Example 4.3: Array of Objects with Arrays.
+    pytest.param(
+        {
             "users": [
                 {"id": 1, "name": "Alice", "tags": ["admin", "verified"]},
                 {"id": 2, "name": "Bob", "tags": ["user"]},
             ]
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-users[2]:
-  [0]{id,name,tags}:
-    id: 1
-    name: Alice
-    tags[2]: admin, verified
-  [1]{id,name,tags}:
-    id: 2
-    name: Bob
-    tags[1]: user"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_4_4_object_with_mixed_content(self):
-        """Example 4.4: Object with Mixed Content."""
-        data = {
+        },
+        _GOLDENS["4_3_array_of_objects_with_arrays"],
+        None,
+        id="4_3_array_of_objects_with_arrays",
+    ),
+    # Example 4.4: Object with Mixed Content.
+    pytest.param(
+        {
             "data": {
                 "simple_field": "value",
                 "nested_object": {"x": 1, "y": 2},
                 "array_field": [1, 2, 3],
                 "another_simple": 42,
             }
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-data{simple_field,nested_object,array_field,another_simple}:
-  simple_field: value
-  nested_object{x,y}: x: 1 y: 2
-  array_field[3]: 1, 2, 3
-  another_simple: 42"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-
-class TestSpecialCharacters:
-    """Tests for Special Characters (Section 5)."""
-
-    def test_5_1_delimiter_in_values(self):
-        """Example 5.1: Delimiter in Values."""
-        data = {"items": [{"name": "Item, A", "price": 10}, {"name": "Item B", "price": 20}]}
-        tonl = encode(data)
-        # Auto-select pipe delimiter because of commas in data
-        assert (
-            """#version 1.0
-#delimiter |
-items[2]{name,price}:
-  Item, A | 10
-  Item B | 20"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_5_2_quotes_in_values(self):
-        """Example 5.2: Quotes in Values."""
-        data = {
+        },
+        _GOLDENS["4_4_object_with_mixed_content"],
+        None,
+        id="4_4_object_with_mixed_content",
+    ),
+    # Section 5: Special Characters
+    # Example 5.1: Delimiter in Values.
+    # Auto-select pipe delimiter because of commas in data
+    # delimiter |
+    pytest.param(
+        {"items": [{"name": "Item, A", "price": 10}, {"name": "Item B", "price": 20}]},
+        _GOLDENS["5_1_delimiter_in_values"],
+        None,
+        id="5_1_delimiter_in_values",
+    ),
+    # Example 5.2: Quotes in Values.
+    # Expect exact TONL as documented in TRANSFORMATION_EXAMPLES (including
+    # correct escaping of internal quotes and triple-quotes).
+    pytest.param(
+        {
             "quote1": 'She said "hello"',
             "quote2": 'It\'s a "test"',
             "triple": 'Has """ triple quotes',
-        }
-        tonl = encode(data)
-        # Expect exact TONL as documented in TRANSFORMATION_EXAMPLES (including
-        # correct escaping of internal quotes and triple-quotes).
-        assert (
-            '#version 1.0\nroot{quote1,quote2,triple}:\n  quote1: "She said ""hello"""\n  quote2: "It\'s a ""test"""\n  triple: """Has \\""" triple quotes"""'  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_5_3_backslashes_and_paths(self):
-        """Example 5.3: Backslashes and Paths."""
-        data = {
+        },
+        _GOLDENS["5_2_quotes_in_values"],
+        None,
+        id="5_2_quotes_in_values",
+    ),
+    # Example 5.3: Backslashes and Paths.
+    # Ensure backslash-heavy values survive a full encode/decode roundtrip.
+    pytest.param(
+        {
             "windows_path": "C:\\Users\\Alice\\Documents",
             "regex": "\\d+\\.\\d+",
             "normal": "No backslash",
-        }
-        tonl = encode(data)
-        # Ensure backslash-heavy values survive a full encode/decode roundtrip.
-        assert decode(tonl) == data
-
-    def test_5_4_unicode_and_emoji(self):
-        """Example 5.4: Unicode and Emoji."""
-        data = {"emoji": "Hello 👋 World 🌍", "unicode": "Héllo Wörld", "chinese": "你好世界"}
-        tonl = encode(data)
-        # All fields are primitives and fit comfortably on a single line.
-        assert (
-            "#version 1.0\nroot{emoji,unicode,chinese}: emoji: Hello 👋 World 🌍 unicode: Héllo Wörld chinese: 你好世界"  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-
-class TestEdgeCases:
-    """Tests for Edge Cases (Section 6)."""
-
-    def test_6_1_empty_and_whitespace(self):
-        """Example 6.1: Empty and Whitespace."""
-        data = {
+        },
+        None,
+        None,
+        id="5_3_backslashes_and_paths",
+    ),
+    # Example 5.4: Unicode and Emoji.
+    # All fields are primitives and fit comfortably on a single line.
+    pytest.param(
+        {"emoji": "Hello 👋 World 🌍", "unicode": "Héllo Wörld", "chinese": "你好世界"},
+        _GOLDENS["5_4_unicode_and_emoji"],
+        None,
+        id="5_4_unicode_and_emoji",
+    ),
+    # Section 6: Edge Cases
+    # Example 6.1: Empty and Whitespace.
+    pytest.param(
+        {
             "empty_string": "",
             "space": " ",
             "spaces": "   ",
             "leading": "  text",
             "trailing": "text  ",
             "both": "  text  ",
-        }
-        tonl = encode(data)
-        assert (
-            '''#version 1.0
-root{empty_string,space,spaces,leading,trailing,both}:
-  empty_string: ""
-  space: " "
-  spaces: "   "
-  leading: "  text"
-  trailing: "text  "
-  both: "  text  "'''
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_6_2_reserved_words_as_strings(self):
-        """Example 6.2: Reserved Words as Strings."""
-        data = {
+        },
+        _GOLDENS["6_1_empty_and_whitespace"],
+        None,
+        id="6_1_empty_and_whitespace",
+    ),
+    # Example 6.2: Reserved Words as Strings.
+    pytest.param(
+        {
             "true_string": "true",
             "false_string": "false",
             "null_string": "null",
             "undefined_string": "undefined",
             "infinity_string": "Infinity",
-        }
-        tonl = encode(data)
-        assert (
-            '''#version 1.0
-root{true_string,false_string,null_string,undefined_string,infinity_string}:
-  true_string: "true"
-  false_string: "false"
-  null_string: "null"
-  undefined_string: "undefined"
-  infinity_string: "Infinity"'''
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_6_3_number_like_strings(self):
-        """Example 6.3: Number-like Strings."""
-        data = {
+        },
+        _GOLDENS["6_2_reserved_words_as_strings"],
+        None,
+        id="6_2_reserved_words_as_strings",
+    ),
+    # Example 6.3: Number-like Strings.
+    pytest.param(
+        {
             "integer_string": "123",
             "decimal_string": "3.14",
             "scientific_string": "1e10",
             "phone_number": "555-1234",
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{integer_string,decimal_string,scientific_string,phone_number}:
-  integer_string: "123"
-  decimal_string: "3.14"
-  scientific_string: "1e10"
-  phone_number: 555-1234"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_6_4_multiline_strings(self):
-        """Example 6.4: Multiline Strings."""
-        data = {
+        },
+        _GOLDENS["6_3_number_like_strings"],
+        None,
+        id="6_3_number_like_strings",
+    ),
+    # Example 6.4: Multiline Strings.
+    pytest.param(
+        {
             "code": "function hello() {\n  return 'world';\n}",
             "poem": "Line 1\nLine 2\nLine 3",
-        }
-        tonl = encode(data)
-        assert (
-            '''#version 1.0
-root{code,poem}:
-  code: """function hello() {
-  return 'world';
-}"""
-  poem: """Line 1
-Line 2
-Line 3"""'''
-            == tonl
-        )
-        assert decode(tonl) == data
-
-
-class TestRealWorldExamples:
-    """Tests for Real-World Examples (Section 7)."""
-
-    def test_7_1_user_database(self):
-        """Example 7.1: User Database."""
-        data = {
+        },
+        _GOLDENS["6_4_multiline_strings"],
+        None,
+        id="6_4_multiline_strings",
+    ),
+    # Section 7: Real-World Examples
+    # Example 7.1: User Database.
+    pytest.param(
+        {
             "users": [
                 {
                     "id": 1001,
@@ -461,21 +305,14 @@ class TestRealWorldExamples:
                     "lastLogin": None,
                 },
             ]
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-users[3]{id,username,email,firstName,lastName,age,role,verified,lastLogin}:
-  1001, alice_smith, alice@company.com, Alice, Smith, 30, admin, true, 2025-11-04T10:30:00Z
-  1002, bob.jones, bob@company.com, Bob, Jones, 25, user, true, 2025-11-04T09:15:00Z
-  1003, carol_w, carol@personal.com, Carol, White, 35, editor, false, null"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_7_2_api_response(self):
-        """Example 7.2: API Response."""
-        data = {
+        },
+        _GOLDENS["7_1_user_database"],
+        None,
+        id="7_1_user_database",
+    ),
+    # Example 7.2: API Response.
+    pytest.param(
+        {
             "status": "success",
             "timestamp": 1699123456,
             "data": {
@@ -488,28 +325,14 @@ users[3]{id,username,email,firstName,lastName,age,role,verified,lastLogin}:
                 ],
             },
             "meta": {"processingTime": 45, "cacheHit": True},
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{status,timestamp,data,meta}:
-  status: success
-  timestamp: 1699123456
-  data{total,page,pageSize,results}:
-    total: 150
-    page: 1
-    pageSize: 10
-    results[2]{id,title,score}:
-      abc123, First Result, 0.95
-      def456, Second Result, 0.87
-  meta{processingTime,cacheHit}: processingTime: 45 cacheHit: true"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_7_3_configuration_file(self):
-        """Example 7.3: Configuration File."""
-        data = {
+        },
+        _GOLDENS["7_2_api_response"],
+        None,
+        id="7_2_api_response",
+    ),
+    # Example 7.3: Configuration File.
+    pytest.param(
+        {
             "app": {"name": "MyApplication", "version": "2.1.0", "environment": "production"},
             "database": {
                 "host": "db.example.com",
@@ -525,26 +348,14 @@ root{status,timestamp,data,meta}:
                 "connection": {"host": "cache.example.com", "port": 6379},
             },
             "features": {"authentication": True, "analytics": True, "notifications": False},
-        }
-        tonl = encode(data)
-        assert (
-            """#version 1.0
-root{app,database,cache,features}:
-  app{name,version,environment}: name: MyApplication version: 2.1.0 environment: production
-  database{host,port,name,poolSize,ssl}: host: db.example.com port: 5432 name: myapp_prod poolSize: 20 ssl: true
-  cache{enabled,ttl,provider,connection}:
-    enabled: true
-    ttl: 3600
-    provider: redis
-    connection{host,port}: host: cache.example.com port: 6379
-  features{authentication,analytics,notifications}: authentication: true analytics: true notifications: false"""  # noqa: E501
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_7_4_ecommerce_product_catalog(self):
-        """Example 7.4: E-commerce Product Catalog."""
-        data = {
+        },
+        _GOLDENS["7_3_configuration_file"],
+        None,
+        id="7_3_configuration_file",
+    ),
+    # Example 7.4: E-commerce Product Catalog.
+    pytest.param(
+        {
             "catalog": {
                 "categories": [
                     {
@@ -573,31 +384,97 @@ root{app,database,cache,features}:
                     }
                 ]
             }
+        },
+        _GOLDENS["7_4_ecommerce_product_catalog"],
+        None,
+        id="7_4_ecommerce_product_catalog",
+    ),
+    # Section 9: Type Hints
+    # Example 9.1: Basic Type Hints (without type hints).
+    pytest.param(
+        {"user": {"id": 123, "name": "Alice", "age": 30, "score": 95.5, "active": True}},
+        _GOLDENS["9_1_without_type_hints"],
+        _OPTS_NO_TYPES,
+        id="9_1_without_type_hints",
+    ),
+    # Example 9.1: Basic Type Hints (with type hints).
+    # With type hints present, decoding in non-strict mode should still
+    # succeed and ignore hints for coercion.
+    pytest.param(
+        {"user": {"id": 123, "name": "Alice", "age": 30, "score": 95.5, "active": True}},
+        _GOLDENS["9_1_with_type_hints"],
+        _OPTS_TYPES,
+        id="9_1_with_type_hints",
+    ),
+    # Section 10: Delimiter Examples
+    # Example 10.1: CSV-like Data.
+    # Should auto-select pipe delimiter due to commas in data
+    # delimiter |
+    pytest.param(
+        {
+            "sales": [
+                {"date": "2025-01-01", "amount": 1500.00, "region": "North, East"},
+                {"date": "2025-01-02", "amount": 2300.00, "region": "South"},
+            ]
+        },
+        _GOLDENS["10_1_csv_like_data"],
+        None,
+        id="10_1_csv_like_data",
+    ),
+    # Example 10.2: TSV-like Data.
+    # No special chars, should use default comma delimiter
+    # delimiter \t
+    pytest.param(
+        {
+            "data": [
+                {"col1": "a", "col2": "b", "col3": "c"},
+                {"col1": "d", "col2": "e", "col3": "f"},
+            ]
+        },
+        _GOLDENS["10_2_tsv_like_data"],
+        None,
+        id="10_2_tsv_like_data",
+    ),
+]
+
+
+def _roundtrip(data, expected=None, options=None):
+    """Encode ``data``, compare with ``expected`` if given and check it decodes back."""
+    tonl = encode(data, options)
+    if expected is not None:
+        assert expected == tonl
+    assert decode(tonl) == data
+    return tonl
+
+
+class TestTransformationExamples:
+    """Exact-output and roundtrip tests for the documented examples."""
+
+    @pytest.mark.parametrize(("data", "expected", "options"), CASES)
+    def test_example(self, data, expected, options):
+        """Each example encodes as documented and decodes back to its data."""
+        _roundtrip(data, expected, options)
+
+
+class TestSimpleTypes:
+    """Tests for Simple Types (Section 1)."""
+
+    def test_1_3_special_numeric_values(self):
+        """Example 1.3: Special Numeric Values."""
+        data = {
+            "infinity": float("inf"),
+            "negative_infinity": float("-inf"),
+            "not_a_number": float("nan"),
+            "infinity_string": "Infinity",
         }
         tonl = encode(data)
-        assert (
-            """#version 1.0
-catalog{categories}:
-  categories[1]:
-    [0]{id,name,products}:
-      id: 1
-      name: Electronics
-      products[2]:
-        [0]{sku,name,price,stock,specs}:
-          sku: LAPTOP-001
-          name: Professional Laptop
-          price: 1299.99
-          stock: 15
-          specs{ram,storage,screen}: ram: 16GB storage: 512GB SSD screen: 15.6 inch
-        [1]{sku,name,price,stock,specs}:
-          sku: MOUSE-001
-          name: Wireless Mouse
-          price: 29.99
-          stock: 100
-          specs{dpi,wireless,battery}: dpi: 3200 wireless: true battery: AAA"""
-            == tonl
-        )
-        assert decode(tonl) == data
+        assert _GOLDENS["1_3_special_numeric_values"] == tonl
+
+        decoded = decode(tonl)
+        assert decoded["infinity"] == float("inf")
+        assert decoded["negative_infinity"] == float("-inf")
+        assert math.isnan(decoded["not_a_number"])
+        assert decoded["infinity_string"] == "Infinity"
 
 
 class TestDelimiterComparison:
@@ -613,9 +490,8 @@ class TestDelimiterComparison:
         }
 
         # With auto-selection, should choose pipe delimiter due to commas in data
-        tonl = encode(data)
+        tonl = _roundtrip(data)
         assert "#delimiter |" in tonl
-        assert decode(tonl) == data
 
     def test_8_2_smart_delimiter_selection(self):
         """Example 8.2: Smart Delimiter Selection.
@@ -637,28 +513,6 @@ class TestDelimiterComparison:
 class TestTypeHints:
     """Tests for Type Hints (Section 9)."""
 
-    def test_9_1_basic_type_hints(self):
-        """Example 9.1: Basic Type Hints."""
-        data = {"user": {"id": 123, "name": "Alice", "age": 30, "score": 95.5, "active": True}}
-
-        # Without type hints
-        tonl_no_types = encode(data, EncodeOptions(include_types=False))
-        assert (
-            "#version 1.0\nuser{id,name,age,score,active}: id: 123 name: Alice age: 30 score: 95.5 active: true"  # noqa: E501
-            == tonl_no_types
-        )
-        assert decode(tonl_no_types) == data
-
-        # With type hints
-        tonl_types = encode(data, EncodeOptions(include_types=True))
-        assert (
-            "#version 1.0\nuser{id:u32,name:str,age:u32,score:f64,active:bool}: id: 123 name: Alice age: 30 score: 95.5 active: true"  # noqa: E501
-            == tonl_types
-        )
-        # With type hints present, decoding in non-strict mode should still
-        # succeed and ignore hints for coercion.
-        assert decode(tonl_types) == data
-
     def test_9_2_type_inference(self):
         """Example 9.2: Type Inference Chart."""
         # Test a representative subset of the inference table.
@@ -674,9 +528,7 @@ class TestTypeHints:
         ]
 
         for data, expected_fragment in test_cases:
-            tonl = encode(data)
-            assert expected_fragment in tonl
-            assert decode(tonl) == data
+            assert expected_fragment in _roundtrip(data)
 
     def test_9_3_strict_type_validation(self):
         """Example 9.3: Strict Type Validation."""
@@ -688,15 +540,9 @@ class TestTypeHints:
         }
 
         # With type hints and strict mode, valid rows should decode correctly.
-        tonl = encode(data, EncodeOptions(include_types=True))
-        assert (
-            """#version 1.0
-users[2]{id:u32,name:str,age:u32,verified:bool}:
-  1, Alice, 30, true
-  2, Bob, 25, true"""
-            == tonl
-        )
-        assert decode(tonl, DecodeOptions(strict=True)) == data
+        tonl = encode(data, _OPTS_TYPES)
+        assert _GOLDENS["9_3_strict_type_validation"] == tonl
+        assert decode(tonl, _OPTS_STRICT) == data
 
         # Invalid example from the docs: "thirty" cannot be coerced to u32.
         invalid_tonl = """#version 1.0
@@ -704,48 +550,4 @@ users[1]{id:u32,name:str,age:u32,verified:bool}:
   1, Alice, thirty, true"""
 
         with pytest.raises(TypeError):
-            decode(invalid_tonl, DecodeOptions(strict=True))
-
-
-class TestDelimiterExamples:
-    """Tests for Section 10 Delimiter Examples."""
-
-    def test_10_1_csv_like_data(self):
-        """Example 10.1: CSV-like Data."""
-        data = {
-            "sales": [
-                {"date": "2025-01-01", "amount": 1500.00, "region": "North, East"},
-                {"date": "2025-01-02", "amount": 2300.00, "region": "South"},
-            ]
-        }
-        tonl = encode(data)
-        # Should auto-select pipe delimiter due to commas in data
-        assert (
-            """#version 1.0
-#delimiter |
-sales[2]{date,amount,region}:
-  2025-01-01 | 1500.00 | North, East
-  2025-01-02 | 2300.00 | South"""
-            == tonl
-        )
-        assert decode(tonl) == data
-
-    def test_10_2_tsv_like_data(self):
-        """Example 10.2: TSV-like Data."""
-        data = {
-            "data": [
-                {"col1": "a", "col2": "b", "col3": "c"},
-                {"col1": "d", "col2": "e", "col3": "f"},
-            ]
-        }
-        tonl = encode(data)
-        # No special chars, should use default comma delimiter
-        assert (
-            """#version 1.0
-#delimiter \t
-data[2]{col1,col2,col3}:
-  a	b	c
-  d	e	f"""
-            == tonl
-        )
-        assert decode(tonl) == data
+            decode(invalid_tonl, _OPTS_STRICT)